@@ -2,9 +2,34 @@
 from garage import create_app
 from garage.extensions import db
 
+# Trigram GIN indexes let Postgres serve the search route's ILIKE '%term%' filters.
+TRIGRAM_INDEXES = {
+    'boxes': ('name', 'location', 'description'),
+    'items': ('name', 'category', 'notes'),
+}
+
 app = create_app()
-with app.app_context():
-    db.session.execute(db.text('ALTER TABLE boxes ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP'))
-    db.session.execute(db.text('ALTER TABLE items ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP'))
-    db.session.commit()
-    print('Columns added successfully!')
\ No newline at end of file
+with app.app_context(), db.engine.begin() as conn:
+    # Inspect instead of ADD COLUMN IF NOT EXISTS, which SQLite does not support.
+    inspector = db.inspect(conn)
+    for table in ('boxes', 'items'):
+        columns = {column['name'] for column in inspector.get_columns(table)}
+        if 'updated_at' not in columns:
+            conn.execute(db.text(f'ALTER TABLE {table} ADD COLUMN updated_at TIMESTAMP'))
+
+    conn.execute(db.text('CREATE INDEX IF NOT EXISTS ix_boxes_user_id_name ON boxes (user_id, name)'))
+    conn.execute(db.text('DROP INDEX IF EXISTS ix_boxes_user_id'))
+    conn.execute(db.text(
+        'CREATE INDEX IF NOT EXISTS ix_items_box_id_category ON items (box_id, category)'
+    ))
+
+    if conn.dialect.name == 'postgresql':
+        conn.execute(db.text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+        for table, columns in TRIGRAM_INDEXES.items():
+            for column in columns:
+                conn.execute(db.text(
+                    f'CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm '
+                    f'ON {table} USING gin ({column} gin_trgm_ops)'
+                ))
+
+print('Columns and indexes added successfully!')
@@ -3,10 +3,11 @@
 import logging
 import os
 
-from flask import Flask
+from flask import Flask, g, has_request_context, request
+from sqlalchemy import event
 
 from garage.config import get_config
-from garage.extensions import db, login_manager, mail
+from garage.extensions import cache, db, login_manager, mail
 from garage.logging_config import configure_logging
 from dotenv import load_dotenv
 from pathlib import Path
@@ -38,7 +39,8 @@ def create_app(config_name: str | None = None) -> Flask:
     
     _init_extensions(app)
     _register_blueprints(app)
-    _init_admin(app)
+    if app.config.get('ENABLE_ADMIN', True):
+        _init_admin(app)
     _register_error_handlers(app)
     _register_context_processors(app)
     
@@ -54,19 +56,92 @@ def _init_extensions(app: Flask) -> None:
     db.init_app(app)
     login_manager.init_app(app)
     mail.init_app(app)
+    cache.init_app(app)
+    _configure_sqlite(app)
+    _init_query_counter(app)
+    _init_sessions(app)
     
     login_manager.login_view = 'auth.login'
     login_manager.login_message = 'Please log in to access this page.'
     login_manager.login_message_category = 'info'
     
+    from garage.models import User
+    
     @login_manager.user_loader
     def load_user(user_id: str):
-        from garage.models import User
-        return User.query.get(int(user_id))
+        return User.get_cached(int(user_id))
     
     logger.debug("Extensions initialized")
 
 
+def _configure_sqlite(app: Flask) -> None:
+    """Apply WAL mode and cache PRAGMAs to each new SQLite connection."""
+    with app.app_context():
+        engine = db.engine
+    
+    if engine.dialect.name != 'sqlite':
+        return
+    
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA cache_size=-64000')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+    
+    logger.debug("SQLite PRAGMAs configured")
+
+
+def _init_query_counter(app: Flask) -> None:
+    """Warn when one request runs more queries than expected, to catch N+1 regressions."""
+    threshold = app.config.get('QUERY_COUNT_WARN_THRESHOLD')
+    if not threshold:
+        return
+    
+    with app.app_context():
+        engine = db.engine
+    
+    @event.listens_for(engine, 'before_cursor_execute')
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        if has_request_context():
+            g.query_count = g.get('query_count', 0) + 1
+    
+    @app.after_request
+    def warn_on_query_count(response):
+        query_count = g.get('query_count', 0)
+        if query_count > threshold:
+            logger.warning(
+                "Possible N+1: %d queries for %s %s (threshold %d)",
+                query_count, request.method, request.path, threshold,
+                extra={
+                    'path': request.path,
+                    'query_count': query_count,
+                    'threshold': threshold
+                }
+            )
+        return response
+    
+    logger.debug("Query counter enabled", extra={'threshold': threshold})
+
+
+def _init_sessions(app: Flask) -> None:
+    """Store sessions server-side in Redis when configured."""
+    if app.config.get('SESSION_TYPE') != 'redis':
+        return
+    
+    import redis
+    from flask_session import Session
+    
+    if not app.config.get('SESSION_REDIS'):
+        app.config['SESSION_REDIS'] = redis.from_url(app.config['REDIS_URL'])
+    Session(app)
+    
+    logger.debug("Redis sessions configured")
+
+
 def _register_blueprints(app: Flask) -> None:
     """Register route blueprints."""
     from garage.routes import register_blueprints
@@ -103,22 +178,16 @@ def _register_error_handlers(app: Flask) -> None:
 
 
 def _register_context_processors(app: Flask) -> None:
-    """Register template context processors."""
-    
-    @app.context_processor
-    def utility_processor():
-        from garage.services.storage import get_storage_backend
-        
-        def get_file_url(file_path):
-            """Get displayable URL for a file path."""
-            if not file_path:
-                return None
-            storage = get_storage_backend()
-            return storage.get_url(file_path)
-        
-        return {
-            'get_file_url': get_file_url,
-            'app_version': __version__,
-        }
-    
-    logger.debug("Context processors registered")
+    """Register template helpers available to every template."""
+    from garage.services.storage import get_storage_backend
+    
+    def get_file_url(file_path):
+        """Get displayable URL for a file path."""
+        if not file_path:
+            return None
+        return get_storage_backend().get_url(file_path)
+    
+    # Neither value depends on the request, so register them once as Jinja globals.
+    app.jinja_env.globals.update(get_file_url=get_file_url, app_version=__version__)
+    
+    logger.debug("Template globals registered")
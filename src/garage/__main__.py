@@ -6,17 +6,50 @@ from garage import create_app
 from garage.extensions import db
 
 
-def main():
-    """Run the development server."""
-    app = create_app()
-    
+def _exec_gunicorn(host: str, port: int) -> None:
+    """Replace this process with a preforking gunicorn server."""
+    workers = os.environ.get('WEB_CONCURRENCY', str(os.cpu_count() or 1))
+    os.execvp('gunicorn', [
+        'gunicorn',
+        '--workers', workers,
+        '--worker-class', 'gthread',
+        '--threads', '4',
+        '--preload',
+        '--bind', f'{host}:{port}',
+        'garage:create_app()',
+    ])
+
+
+def _create_tables(app) -> None:
+    """Create any missing database tables."""
     with app.app_context():
         db.create_all()
         print("✅ Database tables ready")
-    
+
+
+def main():
+    """Run the development server, or gunicorn in production."""
     host = os.environ.get('HOST', '0.0.0.0')
     port = int(os.environ.get('PORT', 8005))
-    debug = os.environ.get('FLASK_ENV') == 'development'
+    # Creating tables inspects every one first; only do it when asked.
+    init_db = os.environ.get('GARAGE_INIT_DB') == '1'
+    
+    if os.environ.get('FLASK_ENV') == 'production':
+        # gunicorn builds its own app; only build one here if tables must be created first.
+        if init_db:
+            _create_tables(create_app())
+        _exec_gunicorn(host, port)
+    
+    app = create_app()
+    if init_db:
+        _create_tables(app)
+    
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+    
+    if not debug:
+        # Keep Jinja's compiled-template cache even under DevelopmentConfig.
+        app.config['TEMPLATES_AUTO_RELOAD'] = False
+        app.jinja_env.auto_reload = False
     
     print(f"\n🚀 Starting Garage Inventory")
     print(f"📍 Running on http://{host}:{port}/")
@@ -24,7 +57,7 @@ def main():
         print("🔧 Debug mode is ON")
     print("⏹️  Press CTRL+C to stop\n")
     
-    app.run(host=host, port=port, debug=debug)
+    app.run(host=host, port=port, debug=debug, use_reloader=debug, threaded=True)
 
 
 if __name__ == '__main__':
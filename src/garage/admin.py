@@ -6,6 +6,7 @@ from flask import Flask, redirect, url_for
 from flask_admin import Admin, AdminIndexView, expose
 from flask_admin.contrib.sqla import ModelView
 from flask_login import current_user
+from sqlalchemy.orm import joinedload, load_only, raiseload, undefer
 
 from garage.extensions import db
 from garage.models import Box, Item, User
@@ -47,20 +48,32 @@ class UserAdminView(SecureModelView):
     column_exclude_list = ['password_hash']
     form_excluded_columns = ['password_hash', 'boxes']
     form_widget_args = {'created_at': {'disabled': True}}
+    
+    def get_query(self):
+        # The list never shows password_hash, so keep the hashes out of the result rows.
+        return super().get_query().options(
+            load_only(User.id, User.username, User.email, User.is_admin, User.created_at),
+            raiseload('*'),
+        )
 
 
 class BoxAdminView(SecureModelView):
     """Admin view for Box model."""
     
-    column_list = ['id', 'name', 'location', 'owner', 'item_count', 'created_at']
+    column_list = ['id', 'name', 'location', 'owner_username', 'item_count', 'created_at']
+    column_labels = {'owner_username': 'Owner'}
     column_searchable_list = ['name', 'location', 'description']
     column_filters = ['location', 'created_at', 'owner.username']
-    column_sortable_list = ['id', 'name', 'location', 'created_at']
+    column_sortable_list = ['id', 'name', 'location', 'owner_username', 'item_count', 'created_at']
+    form_excluded_columns = ['item_count', 'owner_username']
     
-    column_formatters = {
-        'owner': lambda v, c, m, p: m.owner.username if m.owner else 'N/A',
-        'item_count': lambda v, c, m, p: m.item_count,
-    }
+    def get_query(self):
+        # Owner names and item counts come from inline subqueries; any lazy relationship load fails loudly.
+        return super().get_query().options(
+            undefer(Box.owner_username),
+            undefer(Box.item_count),
+            raiseload('*'),
+        )
 
 
 class ItemAdminView(SecureModelView):
@@ -74,6 +87,13 @@ class ItemAdminView(SecureModelView):
     column_formatters = {
         'box': lambda v, c, m, p: m.box.name if m.box else 'N/A',
     }
+    
+    def get_query(self):
+        # Only the box name is shown, so the join skips the other box columns.
+        return super().get_query().options(
+            joinedload(Item.box).load_only(Box.name),
+            raiseload('*'),
+        )
 
 
 def init_admin(app: Flask) -> Admin:
@@ -6,6 +6,36 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 
+def _engine_options_for(database_uri: str | None) -> dict:
+    """Connection pool settings suited to the configured database."""
+    if not database_uri or database_uri == 'sqlite:///:memory:':
+        return {}
+    
+    if database_uri.startswith('sqlite'):
+        # Keep a few long-lived connections so SQLite's page cache stays warm.
+        return {
+            'pool_size': 5,
+            'max_overflow': 5,
+            'connect_args': {'check_same_thread': False, 'timeout': 30},
+            'query_cache_size': 1200,
+        }
+    
+    options = {
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+        'query_cache_size': 1200,
+        'insertmanyvalues_page_size': 1000,
+    }
+    
+    if database_uri.startswith(('postgresql://', 'postgresql+psycopg2://')):
+        # Batch executemany UPDATE/DELETE too, not just multi-VALUES INSERT.
+        options['executemany_mode'] = 'values_plus_batch'
+    
+    return options
+
+
 class BaseConfig:
     """Base configuration with shared defaults."""
     
@@ -16,6 +46,21 @@ class BaseConfig:
     LOG_LEVEL = 'INFO'
     LOG_FORMAT = 'json'
     
+    # Redis (optional) - server-side sessions and a cache shared by all workers
+    REDIS_URL = os.environ.get('REDIS_URL')
+    SESSION_TYPE = 'redis' if REDIS_URL else None
+    
+    # Caching
+    CACHE_TYPE = 'RedisCache' if REDIS_URL else 'SimpleCache'
+    CACHE_REDIS_URL = REDIS_URL
+    CACHE_DEFAULT_TIMEOUT = 300
+    USER_CACHE_TIMEOUT = 60
+    # Per-process caches would keep a changed or deleted user logged in on other workers.
+    USER_CACHE_ENABLED = CACHE_TYPE == 'RedisCache'
+    # Likewise, a per-process category list would miss new categories on other workers.
+    CATEGORY_CACHE_ENABLED = CACHE_TYPE == 'RedisCache'
+    CATEGORY_CACHE_TIMEOUT = 300
+    
     # Storage
     STORAGE_BACKEND = 'local'
     STORAGE_PATH = 'static'
@@ -27,11 +72,15 @@ class BaseConfig:
     S3_SECRET_ACCESS_KEY = os.environ.get('AWS_SECRET_ACCESS_KEY')
     S3_ENDPOINT_URL = os.environ.get('S3_ENDPOINT_URL')
     S3_PREFIX = 'garage-inventory'
+    S3_ASYNC_UPLOADS = os.environ.get('S3_ASYNC_UPLOADS', 'false').lower() == 'true'
+    
+    # Admin dashboard; workers that never serve /admin can skip loading Flask-Admin.
+    ENABLE_ADMIN = os.environ.get('ENABLE_ADMIN', 'true').lower() == 'true'
     
     # Security
     PASSWORD_RESET_EXPIRY = 3600  # 1 hour
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB
-    ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
+    ALLOWED_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'webp'})
     
     # Email
     MAIL_SERVER = os.environ.get('MAIL_SERVER', 'smtp.gmail.com')
@@ -49,11 +98,13 @@ class DevelopmentConfig(BaseConfig):
     DEBUG = True
     LOG_LEVEL = 'DEBUG'
     LOG_FORMAT = 'text'
+    QUERY_COUNT_WARN_THRESHOLD = 20
     
     SQLALCHEMY_DATABASE_URI = os.environ.get(
         'DATABASE_URL',
         f'sqlite:///{BASE_DIR / "inventory.db"}'
     )
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options_for(SQLALCHEMY_DATABASE_URI)
     
     STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'local')
     MAIL_SUPPRESS_SEND = True
@@ -64,9 +115,10 @@ class ProductionConfig(BaseConfig):
     
     DEBUG = False
     LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
-    LOG_FORMAT = 'json'
+    LOG_FORMAT = os.environ.get('LOG_FORMAT', 'json')
+    # File or named pipe for LOG_FORMAT=msgpack frames, kept apart from stdout.
+    LOG_MSGPACK_PATH = os.environ.get('LOG_MSGPACK_PATH')
     
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL')
     STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 's3')
     
     SESSION_COOKIE_SECURE = True
@@ -78,6 +130,7 @@ class ProductionConfig(BaseConfig):
     if _database_url.startswith('postgres://'):
         _database_url = _database_url.replace('postgres://', 'postgresql://', 1)
     SQLALCHEMY_DATABASE_URI = _database_url
+    SQLALCHEMY_ENGINE_OPTIONS = _engine_options_for(_database_url)
     
     @classmethod
     def init_app(cls, app):
@@ -105,6 +158,12 @@ class TestingConfig(BaseConfig):
     STORAGE_PATH = '/tmp/garage-test-storage'
     WTF_CSRF_ENABLED = False
     MAIL_SUPPRESS_SEND = True
+    
+    REDIS_URL = None
+    SESSION_TYPE = None
+    CACHE_TYPE = 'SimpleCache'
+    USER_CACHE_ENABLED = False
+    CATEGORY_CACHE_ENABLED = False
 
 
 config = {
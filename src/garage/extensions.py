@@ -1,9 +1,11 @@
 # src/garage/extensions.py
 """Flask extensions initialization."""
+from flask_caching import Cache
 from flask_login import LoginManager
 from flask_mail import Mail
 from flask_sqlalchemy import SQLAlchemy
 
+cache = Cache()
 db = SQLAlchemy()
 login_manager = LoginManager()
 mail = Mail()
@@ -2,6 +2,7 @@
 """WTForms form definitions."""
 from flask_wtf import FlaskForm
 from flask_wtf.file import FileAllowed, FileField
+from sqlalchemy import or_, select
 from wtforms import (
     BooleanField,
     DecimalField,
@@ -18,11 +19,16 @@ from wtforms.validators import (
     Length,
     NumberRange,
     Optional,
-    ValidationError,
 )
 
+from garage.config import BaseConfig
+from garage.extensions import db
 from garage.models import User
 
+USERNAME_TAKEN = 'Username already taken. Please choose another.'
+EMAIL_TAKEN = 'Email already registered. Please use another or login.'
+IMAGE_EXTENSIONS = tuple(sorted(BaseConfig.ALLOWED_EXTENSIONS))
+
 
 class RegistrationForm(FlaskForm):
     """User registration form."""
@@ -45,13 +51,29 @@ class RegistrationForm(FlaskForm):
     ])
     submit = SubmitField('Register')
     
-    def validate_username(self, field):
-        if User.query.filter_by(username=field.data).first():
-            raise ValidationError('Username already taken. Please choose another.')
-    
-    def validate_email(self, field):
-        if User.query.filter_by(email=field.data).first():
-            raise ValidationError('Email already registered. Please use another or login.')
+    def validate(self, extra_validators=None) -> bool:
+        """Validate fields, then check username and email uniqueness in one query."""
+        is_valid = super().validate(extra_validators=extra_validators)
+        
+        conditions = []
+        if self.username.data:
+            conditions.append(User.username == self.username.data)
+        if self.email.data:
+            conditions.append(User.email == self.email.data)
+        if not conditions:
+            return is_valid
+        
+        for username, email in db.session.execute(
+            select(User.username, User.email).where(or_(*conditions))
+        ):
+            if username == self.username.data:
+                self.username.errors.append(USERNAME_TAKEN)
+                is_valid = False
+            if email == self.email.data:
+                self.email.errors.append(EMAIL_TAKEN)
+                is_valid = False
+        
+        return is_valid
 
 
 class LoginForm(FlaskForm):
@@ -104,10 +126,15 @@ class BoxForm(FlaskForm):
     description = TextAreaField('Description', validators=[Optional()])
     image = FileField('Box Image', validators=[
         Optional(),
-        FileAllowed(['jpg', 'jpeg', 'png', 'gif', 'webp'], 'Images only (jpg, png, gif, webp)')
+        FileAllowed(IMAGE_EXTENSIONS, 'Images only (jpg, png, gif, webp)')
     ])
     delete_image = BooleanField('Delete current image')
     submit = SubmitField('Save Box')
+    
+    def populate_obj(self, obj) -> None:
+        """Copy the box columns onto obj; image changes are handled by the route."""
+        for name in ('name', 'location', 'description'):
+            self[name].populate_obj(obj, name)
 
 
 class ItemForm(FlaskForm):
@@ -131,3 +158,9 @@ class ItemForm(FlaskForm):
     ], default=0.0, places=2)
     notes = TextAreaField('Notes', validators=[Optional()])
     submit = SubmitField('Save Item')
+    
+    def populate_obj(self, obj) -> None:
+        """Copy the item columns onto obj, storing value as a float."""
+        for name in ('name', 'quantity', 'category', 'notes'):
+            self[name].populate_obj(obj, name)
+        obj.value = float(self.value.data) if self.value.data else 0.0
@@ -2,47 +2,109 @@
 """Structured logging configuration."""
 import json
 import logging
-import logging.config
-from datetime import datetime, timezone
+import os
+import struct
+import sys
+import time
 from typing import Any
 
-from flask import Flask, g, request
+from flask import Flask, g, has_request_context, request
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class JSONFormatter(logging.Formatter):
     """JSON log formatter for production environments."""
     
-    def format(self, record: logging.LogRecord) -> str:
+    EXTRA_FIELDS = (
+        'user_id', 'box_id', 'item_id', 'email',
+        'duration_ms', 'error', 'status_code',
+        'storage_backend', 'file_path', 'bucket'
+    )
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted second) as one tuple so threads never see a torn pair.
+        self._cached_second: tuple[int, str] = (-1, '')
+    
+    def _timestamp(self, created: float) -> str:
+        """ISO-8601 UTC time of a record, formatting each wall-clock second only once."""
+        second = int(created)
+        cached_second, prefix = self._cached_second
+        if second != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+            self._cached_second = (second, prefix)
+        return f'{prefix}.{int((created - second) * 1e6):06d}+00:00'
+    
+    def _log_data(self, record: logging.LogRecord, timestamp: Any) -> dict[str, Any]:
+        """Collect a record's fields, request context and extras into one dict."""
         log_data: dict[str, Any] = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': timestamp,
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
         }
         
-        try:
-            if request:
-                log_data['request_id'] = getattr(g, 'request_id', None)
-                log_data['path'] = request.path
-                log_data['method'] = request.method
-        except RuntimeError:
-            pass
+        # Startup and background-thread records have no request; probe instead of catching RuntimeError.
+        log_context = g.get('log_context') if has_request_context() else None
+        if log_context:
+            log_data['request_id'], log_data['path'], log_data['method'] = log_context
         
-        extra_fields = [
-            'user_id', 'box_id', 'item_id', 'email',
-            'duration_ms', 'error', 'status_code',
-            'storage_backend', 'file_path', 'bucket'
-        ]
-        for field in extra_fields:
-            if hasattr(record, field):
-                log_data[field] = getattr(record, field)
+        # Extras land in the record's __dict__; reading it directly skips attribute lookup.
+        record_dict = record.__dict__
+        for field in self.EXTRA_FIELDS:
+            if field in record_dict:
+                log_data[field] = record_dict[field]
         
         if record.exc_info:
             log_data['exception'] = self.formatException(record.exc_info)
         
+        return log_data
+    
+    def format(self, record: logging.LogRecord) -> str:
+        log_data = self._log_data(record, self._timestamp(record.created))
+        if orjson is not None:
+            return orjson.dumps(log_data, default=str).decode()
         return json.dumps(log_data, default=str)
 
 
+class MsgPackFormatter(JSONFormatter):
+    """Structured formatter for binary log shipping; format() still returns a JSON str."""
+    
+    def log_data(self, record: logging.LogRecord) -> dict[str, Any]:
+        """Return a record's fields for a binary encoder, keeping the raw epoch timestamp."""
+        return self._log_data(record, record.created)
+
+
+class MsgPackFileHandler(logging.FileHandler):
+    """Append records to a dedicated file or pipe as length-prefixed MessagePack frames.
+    
+    Each frame is a 4-byte big-endian length followed by the packed record. Frames never
+    go to stdout, so text from gunicorn or print() cannot interleave with them.
+    """
+    
+    def __init__(self, filename: str):
+        import msgpack
+        super().__init__(filename, mode='ab')
+        self._packb = msgpack.packb
+        self.setFormatter(MsgPackFormatter())
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            payload = self._packb(self.formatter.log_data(record), default=str, use_bin_type=True)
+            self.stream.write(struct.pack('>I', len(payload)) + payload)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 class DevelopmentFormatter(logging.Formatter):
     """Colored log formatter for development."""
     
@@ -54,16 +116,22 @@ class DevelopmentFormatter(logging.Formatter):
         'CRITICAL': '\033[35m',
     }
     RESET = '\033[0m'
+    EXTRA_FIELDS = ('user_id', 'box_id', 'item_id', 'error')
+    _EXTRA_KEYS = frozenset(EXTRA_FIELDS)
     
     def format(self, record: logging.LogRecord) -> str:
         color = self.COLORS.get(record.levelname, self.RESET)
         
-        extras = []
-        for field in ['user_id', 'box_id', 'item_id', 'error']:
-            if hasattr(record, field):
-                extras.append(f"{field}={getattr(record, field)}")
-        
-        extra_str = f" [{', '.join(extras)}]" if extras else ""
+        # Most records carry none of the extras; one set check skips the scan for them.
+        record_dict = record.__dict__
+        extra_str = ""
+        if not self._EXTRA_KEYS.isdisjoint(record_dict):
+            extras = [
+                f"{field}={record_dict[field]}"
+                for field in self.EXTRA_FIELDS
+                if field in record_dict
+            ]
+            extra_str = f" [{', '.join(extras)}]"
         
         formatted = (
             f"{color}{record.levelname:8}{self.RESET} "
@@ -76,61 +144,58 @@ class DevelopmentFormatter(logging.Formatter):
         return formatted
 
 
+# Third-party loggers kept at WARNING whatever the app's level.
+QUIET_LOGGERS = ('werkzeug', 'sqlalchemy.engine', 'botocore')
+
+# Formats meant for a log collector, which also get one record per completed request.
+STRUCTURED_FORMATS = ('json', 'msgpack')
+
+request_logger = logging.getLogger('garage.requests')
+
+
+def _use_handler(logger: logging.Logger, level: str, handler: logging.Handler, propagate: bool = True) -> None:
+    """Replace a logger's handlers with the given one and set its level."""
+    for existing in list(logger.handlers):
+        logger.removeHandler(existing)
+        # Releases files held by a previous app's handlers; closing a stdout handler leaves stdout open.
+        if existing is not handler:
+            existing.close()
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = propagate
+
+
 def configure_logging(app: Flask) -> None:
     """Configure logging based on application configuration."""
     log_level = app.config.get('LOG_LEVEL', 'INFO')
     log_format = app.config.get('LOG_FORMAT', 'json')
     
-    if log_format == 'json':
-        formatter_config = {'()': f'{__name__}.JSONFormatter'}
+    if log_format == 'msgpack':
+        log_path = app.config.get('LOG_MSGPACK_PATH')
+        if not log_path:
+            raise ValueError("LOG_FORMAT=msgpack requires LOG_MSGPACK_PATH")
+        handler = MsgPackFileHandler(log_path)
     else:
-        formatter_config = {'()': f'{__name__}.DevelopmentFormatter'}
-    
-    config = {
-        'version': 1,
-        'disable_existing_loggers': False,
-        'formatters': {'standard': formatter_config},
-        'handlers': {
-            'console': {
-                'class': 'logging.StreamHandler',
-                'level': log_level,
-                'formatter': 'standard',
-                'stream': 'ext://sys.stdout',
-            },
-        },
-        'root': {
-            'level': log_level,
-            'handlers': ['console'],
-        },
-        'loggers': {
-            'garage': {
-                'level': log_level,
-                'handlers': ['console'],
-                'propagate': False,
-            },
-            'werkzeug': {'level': 'WARNING', 'handlers': ['console'], 'propagate': False},
-            'sqlalchemy.engine': {'level': 'WARNING', 'handlers': ['console'], 'propagate': False},
-            'botocore': {'level': 'WARNING', 'handlers': ['console'], 'propagate': False},
-        },
-    }
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(JSONFormatter() if log_format == 'json' else DevelopmentFormatter())
+    handler.setLevel(log_level)
     
-    logging.config.dictConfig(config)
+    # Set loggers up directly; dictConfig would rebuild and validate a nested config on every app.
+    _use_handler(logging.getLogger(), log_level, handler)
+    _use_handler(logging.getLogger('garage'), log_level, handler, propagate=False)
+    for name in QUIET_LOGGERS:
+        _use_handler(logging.getLogger(name), 'WARNING', handler, propagate=False)
     
     @app.before_request
     def add_request_id():
-        import uuid
-        g.request_id = str(uuid.uuid4())[:8]
+        g.request_id = os.urandom(4).hex()
+        # Resolve the request proxy once here rather than on every record the formatter sees.
+        g.log_context = (g.request_id, request.path, request.method)
     
-    if log_format == 'json':
+    # With request logging filtered out by level, skip the per-request hook entirely.
+    if log_format in STRUCTURED_FORMATS and request_logger.isEnabledFor(logging.INFO):
         @app.after_request
         def log_request(response):
-            logger = logging.getLogger('garage.requests')
-            logger.info(
-                "Request completed",
-                extra={
-                    'status_code': response.status_code,
-                    'path': request.path,
-                    'method': request.method,
-                }
-            )
+            # Path and method already reach the formatter through g.log_context.
+            request_logger.info("Request completed", extra={'status_code': response.status_code})
             return response
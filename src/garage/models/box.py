@@ -1,7 +1,8 @@
 # src/garage/models/box.py
 """Box model for storage containers."""
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
+
+from sqlalchemy import column, func, inspect, select, table
 
 from garage.extensions import db
 
@@ -9,6 +10,10 @@ if TYPE_CHECKING:
     from garage.models.item import Item
     from garage.models.user import User
 
+# Lightweight views of related tables for the subquery columns; Item and User import Box.
+_items = table('items', column('id'), column('box_id'))
+_users = table('users', column('id'), column('username', db.String))
+
 
 class Box(db.Model):
     """Storage box/container model."""
@@ -23,40 +28,75 @@ class Box(db.Model):
     image_path = db.Column(db.String(500))
     created_at = db.Column(
         db.DateTime,
-        default=lambda: datetime.now(timezone.utc),
+        default=func.now(),
+        server_default=func.now(),
         nullable=False
     )
     updated_at = db.Column(
         db.DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
 
+    owner: db.Mapped["User"] = db.relationship('User', back_populates='boxes')
     items: db.Mapped[list["Item"]] = db.relationship(
         'Item',
-        backref='box',
-        lazy='dynamic',
+        back_populates='box',
         cascade='all, delete-orphan'
     )
 
+    # Number of items per box as a COUNT subquery; deferred, so only pages that show it undefer it.
+    item_count = db.column_property(
+        select(func.count(_items.c.id))
+        .where(_items.c.box_id == id)
+        .correlate_except(_items)
+        .scalar_subquery(),
+        deferred=True
+    )
+    # Owner name for admin listings, selected inline instead of loading each owner.
+    owner_username = db.column_property(
+        select(_users.c.username)
+        .where(_users.c.id == user_id)
+        .correlate_except(_users)
+        .scalar_subquery(),
+        deferred=True
+    )
+
+    __table_args__ = (
+        # Serves "my boxes ordered by name" on the dashboard and search, and plain user_id lookups.
+        db.Index('ix_boxes_user_id_name', 'user_id', 'name'),
+    )
+
     def __repr__(self) -> str:
         return f'<Box {self.name}>'
 
-    @property
-    def item_count(self) -> int:
-        """Return number of distinct items in this box."""
-        return self.items.count()
-
     @property
     def total_value(self) -> float:
         """Calculate total value of all items."""
-        total = 0.0
-        for item in self.items:
-            if item.value:
-                total += item.value * item.quantity
-        return total
+        # Routes that render items eager-load them; summing those avoids another query.
+        if 'items' not in inspect(self).unloaded:
+            total = 0.0
+            for item in self.items:
+                if item.value:
+                    total += item.value * item.quantity
+            return total
+        
+        return Box.total_values_for_boxes([self.id]).get(self.id, 0.0)
+
+    @classmethod
+    def total_values_for_boxes(cls, box_ids: Iterable[int]) -> dict[int, float]:
+        """Sum item values for many boxes in one aggregate query; boxes with no valued items are omitted."""
+        from garage.models.item import Item
+        
+        rows = db.session.execute(
+            select(Item.box_id, func.sum(Item.value * Item.quantity))
+            .where(Item.box_id.in_(list(box_ids)), Item.value.isnot(None), Item.value != 0)
+            .group_by(Item.box_id)
+        )
+        return {box_id: float(total or 0.0) for box_id, total in rows}
 
     @property
     def total_items(self) -> int:
@@ -1,8 +1,10 @@
 # src/garage/models/item.py
 """Item model for stored objects."""
-from datetime import datetime, timezone
+from flask import current_app
+from sqlalchemy import func, select
 
-from garage.extensions import db
+from garage.extensions import cache, db
+from garage.models.box import Box
 
 
 class Item(db.Model):
@@ -18,20 +20,25 @@ class Item(db.Model):
     value = db.Column(db.Float, default=0.0)
     created_at = db.Column(
         db.DateTime,
-        default=lambda: datetime.now(timezone.utc),
+        default=func.now(),
+        server_default=func.now(),
         nullable=False
     )
     updated_at = db.Column(
         db.DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     box_id = db.Column(db.Integer, db.ForeignKey('boxes.id'), nullable=False)
 
+    box: db.Mapped["Box"] = db.relationship('Box', back_populates='items')
+
     __table_args__ = (
         db.CheckConstraint('quantity >= 0', name='check_quantity_positive'),
         db.CheckConstraint('value >= 0', name='check_value_positive'),
+        db.Index('ix_items_box_id_category', 'box_id', 'category'),
     )
 
     def __repr__(self) -> str:
@@ -45,3 +52,39 @@ class Item(db.Model):
     def is_owned_by(self, user_id: int) -> bool:
         """Check if this item's box belongs to the given user."""
         return self.box.is_owned_by(user_id)
+
+    @classmethod
+    def categories_for_user(cls, user_id: int) -> list[str]:
+        """Return the sorted distinct categories across a user's boxes, served from cache when possible."""
+        if not current_app.config.get('CATEGORY_CACHE_ENABLED'):
+            return cls._query_categories(user_id)
+        
+        key = cls.categories_cache_key(user_id)
+        categories = cache.get(key)
+        
+        if categories is None:
+            categories = cls._query_categories(user_id)
+            cache.set(key, categories, timeout=current_app.config.get('CATEGORY_CACHE_TIMEOUT', 300))
+        
+        return categories
+
+    @classmethod
+    def _query_categories(cls, user_id: int) -> list[str]:
+        """Query the sorted distinct categories across a user's boxes."""
+        return sorted(db.session.scalars(
+            select(cls.category)
+            .join(cls.box)
+            .where(Box.user_id == user_id, cls.category.isnot(None), cls.category != '')
+            .distinct()
+        ))
+
+    @staticmethod
+    def categories_cache_key(user_id: int) -> str:
+        """Return the cache key for a user's category list."""
+        return f'categories:{user_id}'
+
+    @staticmethod
+    def clear_categories_cache(user_id: int) -> None:
+        """Drop a user's cached category list after their items change."""
+        cache.delete(Item.categories_cache_key(user_id))
+
@@ -1,21 +1,44 @@
 # src/garage/models/user.py
 """User model for authentication and authorization."""
-from datetime import datetime, timezone
+from functools import lru_cache
+import hashlib
 import logging
 from typing import TYPE_CHECKING
 
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from flask import current_app
 from flask_login import UserMixin
-from itsdangerous import URLSafeTimedSerializer
-from werkzeug.security import check_password_hash, generate_password_hash
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
+from sqlalchemy import event
+from sqlalchemy.orm import make_transient_to_detached
+from werkzeug.security import check_password_hash
 
-from garage.extensions import db
+from garage.extensions import cache, db
 
 if TYPE_CHECKING:
     from garage.models.box import Box
 
 logger = logging.getLogger(__name__)
 
+# Columns kept in the user cache - just what authenticated requests read.
+CACHED_USER_COLUMNS = ('id', 'username', 'email', 'is_admin')
+
+# Argon2id at the OWASP baseline: 2 passes over 46 MiB, single lane.
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=46 * 1024, parallelism=1)
+
+
+@lru_cache(maxsize=4)
+def _reset_serializer(secret_key: str, legacy: bool = False) -> URLSafeTimedSerializer:
+    """Return a reset-token serializer, built once per secret key.
+    
+    Tokens are signed with HMAC-BLAKE2b. ``legacy`` gives the old HMAC-SHA1
+    serializer so links issued before the switch keep working until they expire.
+    """
+    if legacy:
+        return URLSafeTimedSerializer(secret_key)
+    return URLSafeTimedSerializer(secret_key, signer_kwargs={'digest_method': hashlib.blake2b})
+
 
 class User(UserMixin, db.Model):
     """User account model."""
@@ -29,29 +52,46 @@ class User(UserMixin, db.Model):
     is_admin = db.Column(db.Boolean, default=False, nullable=False)
     created_at = db.Column(
         db.DateTime,
-        default=lambda: datetime.now(timezone.utc),
+        default=db.func.now(),
+        server_default=db.func.now(),
         nullable=False
     )
 
     boxes: db.Mapped[list["Box"]] = db.relationship(
         'Box',
-        backref='owner',
-        lazy='dynamic',
+        back_populates='owner',
         cascade='all, delete-orphan'
     )
 
     def set_password(self, password: str) -> None:
         """Hash and store password."""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = _password_hasher.hash(password)
         logger.debug("Password updated", extra={'user_id': self.id})
 
     def check_password(self, password: str) -> bool:
-        """Verify password against stored hash."""
-        return check_password_hash(self.password_hash, password)
+        """Verify password against stored hash, replacing an outdated hash on success.
+        
+        The new hash is only set on the instance; the caller commits it.
+        """
+        if not self.password_hash.startswith('$argon2'):
+            # Hashes from before the Argon2 switch are werkzeug pbkdf2/scrypt strings.
+            if not check_password_hash(self.password_hash, password):
+                return False
+            self.set_password(password)
+            return True
+        
+        try:
+            _password_hasher.verify(self.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        
+        if _password_hasher.check_needs_rehash(self.password_hash):
+            self.set_password(password)
+        return True
 
     def get_reset_token(self) -> str:
         """Generate a password reset token."""
-        serializer = URLSafeTimedSerializer(current_app.config['SECRET_KEY'])
+        serializer = _reset_serializer(current_app.config['SECRET_KEY'])
         token = serializer.dumps(self.email, salt='password-reset-salt')
         logger.info("Password reset token generated", extra={'user_id': self.id})
         return token
@@ -59,9 +99,16 @@ class User(UserMixin, db.Model):
     @staticmethod
     def verify_reset_token(token: str, expiry: int = 3600) -> "User | None":
         """Verify reset token and return user if valid."""
-        serializer = URLSafeTimedSerializer(current_app.config['SECRET_KEY'])
+        secret_key = current_app.config['SECRET_KEY']
         try:
-            email = serializer.loads(token, salt='password-reset-salt', max_age=expiry)
+            try:
+                email = _reset_serializer(secret_key).loads(token, salt='password-reset-salt', max_age=expiry)
+            except SignatureExpired:
+                raise
+            except BadSignature:
+                email = _reset_serializer(secret_key, legacy=True).loads(
+                    token, salt='password-reset-salt', max_age=expiry
+                )
         except Exception as e:
             logger.warning("Invalid reset token", extra={'error': str(e)})
             return None
@@ -71,10 +118,47 @@ class User(UserMixin, db.Model):
             logger.info("Reset token verified", extra={'user_id': user.id})
         return user
 
+    @classmethod
+    def get_cached(cls, user_id: int) -> "User | None":
+        """Load a user by id, serving the common columns from cache when possible."""
+        if not current_app.config.get('USER_CACHE_ENABLED'):
+            return db.session.get(cls, user_id)
+        
+        key = cls.cache_key(user_id)
+        data = cache.get(key)
+        
+        if data is None:
+            user = db.session.get(cls, user_id)
+            if user is not None:
+                cache.set(
+                    key,
+                    {column: getattr(user, column) for column in CACHED_USER_COLUMNS},
+                    timeout=current_app.config.get('USER_CACHE_TIMEOUT', 60)
+                )
+            return user
+        
+        # Attach as a persistent instance without a SELECT; other columns load on access.
+        user = cls(**data)
+        make_transient_to_detached(user)
+        return db.session.merge(user, load=False)
+
+    @staticmethod
+    def cache_key(user_id: int) -> str:
+        """Return the cache key for a user's cached columns."""
+        return f'user:{user_id}'
+
     @property
     def box_count(self) -> int:
         """Return number of boxes owned by this user."""
-        return self.boxes.count()
+        return len(self.boxes)
 
     def __repr__(self) -> str:
         return f'<User {self.username}>'
+
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_user_cache(mapper, connection, target: User) -> None:
+    """Drop a user's cached columns whenever the row changes."""
+    cache.delete(User.cache_key(target.id))
+
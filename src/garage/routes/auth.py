@@ -56,6 +56,15 @@ def login():
         user = User.query.filter_by(username=form.username.data).first()
         
         if user and user.check_password(form.password.data):
+            # check_password swaps an outdated hash for an Argon2 one; save it with the login.
+            if db.session.is_modified(user):
+                try:
+                    db.session.commit()
+                    logger.info("Password hash upgraded", extra={'user_id': user.id})
+                except Exception as e:
+                    db.session.rollback()
+                    logger.warning("Failed to upgrade password hash", extra={'user_id': user.id, 'error': str(e)})
+            
             login_user(user)
             logger.info("User logged in", extra={'user_id': user.id})
             flash(f'Welcome back, {user.username}!', 'success')
@@ -1,13 +1,16 @@
 # src/garage/routes/boxes.py
 """Box management routes."""
 import logging
+from io import BytesIO
 
-from flask import Blueprint, flash, redirect, render_template, url_for
+from flask import Blueprint, flash, redirect, render_template, send_file, url_for
 from flask_login import current_user, login_required
+from sqlalchemy import delete
+from sqlalchemy.orm import raiseload, selectinload
 
 from garage.extensions import db
 from garage.forms import BoxForm
-from garage.models import Box
+from garage.models import Box, Item
 from garage.services import QRService
 from garage.services.storage import get_storage_backend
 from garage.utils import owns_box
@@ -16,12 +19,20 @@ logger = logging.getLogger(__name__)
 
 bp = Blueprint('boxes', __name__)
 
+# A box's QR payload never changes, so browsers may keep the image for a year.
+QR_IMAGE_MAX_AGE = 365 * 24 * 3600
+
 
 @bp.route('/dashboard')
 @login_required
 def dashboard():
     """Display user's box list."""
-    boxes = Box.query.filter_by(user_id=current_user.id).order_by(Box.name).all()
+    boxes = (
+        Box.query.options(selectinload(Box.items))
+        .filter_by(user_id=current_user.id)
+        .order_by(Box.name)
+        .all()
+    )
     logger.debug("Dashboard loaded", extra={'user_id': current_user.id, 'box_count': len(boxes)})
     return render_template('boxlist.html', boxes=boxes)
 
@@ -34,19 +45,12 @@ def create_box():
     
     if form.validate_on_submit():
         try:
-            box = Box(
-                name=form.name.data,
-                location=form.location.data,
-                description=form.description.data,
-                user_id=current_user.id
-            )
+            box = Box(user_id=current_user.id)
+            form.populate_obj(box)
             
             db.session.add(box)
             db.session.flush()
             
-            qr_path = QRService.generate_for_box(box.id)
-            box.qr_code_path = qr_path
-            
             if form.image.data:
                 storage = get_storage_backend()
                 image_path = storage.save_image(form.image.data, box.id, 'box')
@@ -69,26 +73,50 @@ def create_box():
 
 @bp.route('/box/<int:box_id>')
 @login_required
-@owns_box
+@owns_box(options=(selectinload(Box.items),))
 def view_box(box: Box):
     """Display box details and items."""
     logger.debug("Viewing box", extra={'box_id': box.id})
     return render_template('boxdetail.html', box=box)
 
 
+@bp.route('/box/<int:box_id>/qr.png')
+@login_required
+@owns_box(options=(raiseload('*'),))
+def qr_image(box: Box):
+    """Serve a box's QR code, rendered on demand and cached by the browser."""
+    return send_file(
+        BytesIO(QRService.render_png(box.id)),
+        mimetype='image/png',
+        download_name=f'box_{box.id}_qr.png',
+        max_age=QR_IMAGE_MAX_AGE,
+    )
+
+
+@bp.route('/box/<int:box_id>/qr.svg')
+@login_required
+@owns_box(options=(raiseload('*'),))
+def qr_svg(box: Box):
+    """Serve a box's QR code as SVG for on-page display."""
+    return send_file(
+        BytesIO(QRService.render_svg(box.id)),
+        mimetype='image/svg+xml',
+        download_name=f'box_{box.id}_qr.svg',
+        max_age=QR_IMAGE_MAX_AGE,
+    )
+
+
 @bp.route('/box/<int:box_id>/edit', methods=['GET', 'POST'])
 @login_required
-@owns_box
+@owns_box(options=(raiseload('*'),))
 def edit_box(box: Box):
     """Edit an existing box."""
-    form = BoxForm()
+    form = BoxForm(obj=box)
     storage = get_storage_backend()
     
     if form.validate_on_submit():
         try:
-            box.name = form.name.data
-            box.location = form.location.data
-            box.description = form.description.data
+            form.populate_obj(box)
             
             if form.delete_image.data and box.image_path:
                 storage.delete(box.image_path)
@@ -112,17 +140,12 @@ def edit_box(box: Box):
             logger.error("Failed to update box", extra={'box_id': box.id, 'error': str(e)}, exc_info=True)
             flash(f'Error updating box: {str(e)}', 'danger')
     
-    elif not form.is_submitted():
-        form.name.data = box.name
-        form.location.data = box.location
-        form.description.data = box.description
-    
     return render_template('boxform.html', form=form, box=box, title='Edit Box')
 
 
 @bp.route('/box/<int:box_id>/delete', methods=['POST'])
 @login_required
-@owns_box
+@owns_box(options=(raiseload('*'),))
 def delete_box(box: Box):
     """Delete a box and all associated data."""
     try:
@@ -132,11 +155,15 @@ def delete_box(box: Box):
         
         if box.image_path:
             storage.delete(box.image_path)
+        # QR codes are rendered on demand now; this only cleans up files stored by older versions.
         if box.qr_code_path:
             storage.delete(box.qr_code_path)
         
-        db.session.delete(box)
+        # Two set-based DELETEs instead of loading every item for the ORM cascade.
+        db.session.execute(delete(Item).where(Item.box_id == box_id))
+        db.session.execute(delete(Box).where(Box.id == box_id))
         db.session.commit()
+        Item.clear_categories_cache(current_user.id)
         
         logger.info("Box deleted", extra={'box_id': box_id, 'box_name': box_name, 'user_id': current_user.id})
         flash(f'Box "{box_name}" deleted successfully!', 'success')
@@ -148,27 +175,3 @@ def delete_box(box: Box):
     
     return redirect(url_for('boxes.dashboard'))
 
-
-@bp.route('/box/<int:box_id>/regenerate-qr', methods=['POST'])
-@login_required
-@owns_box
-def regenerate_qr(box: Box):
-    """Regenerate QR code for a box."""
-    try:
-        old_path = box.qr_code_path
-        new_path = QRService.regenerate_for_box(box.id, old_path)
-        
-        if new_path:
-            box.qr_code_path = new_path
-            db.session.commit()
-            logger.info("QR code regenerated", extra={'box_id': box.id})
-            flash('QR code regenerated successfully!', 'success')
-        else:
-            flash('Error regenerating QR code.', 'danger')
-            
-    except Exception as e:
-        db.session.rollback()
-        logger.error("Failed to regenerate QR code", extra={'box_id': box.id, 'error': str(e)}, exc_info=True)
-        flash(f'Error regenerating QR code: {str(e)}', 'danger')
-    
-    return redirect(url_for('boxes.view_box', box_id=box.id))
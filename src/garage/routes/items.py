@@ -1,9 +1,13 @@
 # src/garage/routes/items.py
 """Item management routes."""
 import logging
+from types import SimpleNamespace
 
-from flask import Blueprint, flash, redirect, render_template, request, url_for
+from flask import Blueprint, abort, flash, jsonify, redirect, render_template, request, url_for
 from flask_login import current_user, login_required
+from sqlalchemy import insert
+from sqlalchemy.orm import raiseload
+from werkzeug.datastructures import MultiDict
 
 from garage.extensions import db
 from garage.forms import ItemForm
@@ -14,27 +18,52 @@ logger = logging.getLogger(__name__)
 
 bp = Blueprint('items', __name__)
 
+BULK_ITEM_LIMIT = 500
+
+# JSON types accepted for each bulk item field; null means "not given".
+BULK_ITEM_TYPES = {
+    'name': (str,),
+    'quantity': (int,),
+    'category': (str,),
+    'value': (int, float),
+    'notes': (str,),
+}
+
+
+def _bulk_item_formdata(row) -> tuple[MultiDict, dict]:
+    """Check the JSON types of a bulk item row and turn it into form data."""
+    if not isinstance(row, dict):
+        return MultiDict(), {'item': ['Each item must be a JSON object.']}
+    
+    formdata = MultiDict()
+    errors = {}
+    for name, types in BULK_ITEM_TYPES.items():
+        value = row.get(name)
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, types):
+            kind = 'a string' if types == (str,) else 'a number'
+            errors[name] = [f'Must be {kind}.']
+            continue
+        formdata[name] = str(value)
+    return formdata, errors
+
 
 @bp.route('/box/<int:box_id>/item/create', methods=['GET', 'POST'])
 @login_required
-@owns_box
+@owns_box(options=(raiseload('*'),))
 def create_item(box: Box):
     """Create a new item in a box."""
     form = ItemForm()
     
     if form.validate_on_submit():
         try:
-            item = Item(
-                name=form.name.data,
-                quantity=form.quantity.data,
-                category=form.category.data,
-                value=float(form.value.data) if form.value.data else 0.0,
-                notes=form.notes.data,
-                box_id=box.id
-            )
+            item = Item(box_id=box.id)
+            form.populate_obj(item)
             
             db.session.add(item)
             db.session.commit()
+            Item.clear_categories_cache(current_user.id)
             
             logger.info("Item created", extra={
                 'item_id': item.id,
@@ -53,22 +82,69 @@ def create_item(box: Box):
     return render_template('itemform.html', form=form, box=box, title='Add Item')
 
 
+@bp.route('/box/<int:box_id>/items/bulk', methods=['POST'])
+@login_required
+@owns_box(options=(raiseload('*'),))
+def bulk_create_items(box: Box):
+    """Create many items in a box from a JSON list in one INSERT round trip."""
+    payload = request.get_json(silent=True) if request.is_json else None
+    rows = payload.get('items') if isinstance(payload, dict) else None
+    
+    if not isinstance(rows, list) or not rows:
+        return jsonify({'error': 'Expected a JSON object with a non-empty "items" list.'}), 400
+    if len(rows) > BULK_ITEM_LIMIT:
+        return jsonify({'error': f'At most {BULK_ITEM_LIMIT} items can be added at once.'}), 400
+    
+    values = []
+    errors = {}
+    for index, row in enumerate(rows):
+        formdata, type_errors = _bulk_item_formdata(row)
+        if type_errors:
+            errors[index] = type_errors
+            continue
+        
+        form = ItemForm(formdata=formdata, meta={'csrf': False})
+        if not form.validate():
+            errors[index] = form.errors
+            continue
+        
+        item_values = SimpleNamespace()
+        form.populate_obj(item_values)
+        values.append({**vars(item_values), 'box_id': box.id})
+    
+    if errors:
+        return jsonify({'error': 'Invalid items.', 'items': errors}), 400
+    
+    try:
+        db.session.execute(insert(Item), values)
+        db.session.commit()
+        Item.clear_categories_cache(current_user.id)
+    except Exception as e:
+        db.session.rollback()
+        logger.error("Failed to bulk create items", extra={'box_id': box.id, 'error': str(e)}, exc_info=True)
+        return jsonify({'error': 'Could not create items.'}), 500
+    
+    logger.info("Items bulk created", extra={
+        'box_id': box.id,
+        'item_count': len(values),
+        'user_id': current_user.id
+    })
+    return jsonify({'created': len(values)}), 201
+
+
 @bp.route('/item/<int:item_id>/edit', methods=['GET', 'POST'])
 @login_required
 @owns_item
 def edit_item(item: Item, box: Box):
     """Edit an existing item."""
-    form = ItemForm()
+    form = ItemForm(obj=item)
     
     if form.validate_on_submit():
         try:
-            item.name = form.name.data
-            item.quantity = form.quantity.data
-            item.category = form.category.data
-            item.value = float(form.value.data) if form.value.data else 0.0
-            item.notes = form.notes.data
+            form.populate_obj(item)
             
             db.session.commit()
+            Item.clear_categories_cache(current_user.id)
             
             logger.info("Item updated", extra={'item_id': item.id, 'item_name': item.name, 'box_id': box.id})
             flash(f'Item "{item.name}" updated successfully!', 'success')
@@ -79,13 +155,6 @@ def edit_item(item: Item, box: Box):
             logger.error("Failed to update item", extra={'item_id': item.id, 'error': str(e)}, exc_info=True)
             flash(f'Error updating item: {str(e)}', 'danger')
     
-    elif not form.is_submitted():
-        form.name.data = item.name
-        form.quantity.data = item.quantity
-        form.category.data = item.category
-        form.value.data = item.value
-        form.notes.data = item.notes
-    
     return render_template('itemform.html', form=form, item=item, box=box, title='Edit Item')
 
 
@@ -100,6 +169,7 @@ def delete_item(item: Item, box: Box):
         
         db.session.delete(item)
         db.session.commit()
+        Item.clear_categories_cache(current_user.id)
         
         logger.info("Item deleted", extra={
             'item_id': item_id,
@@ -128,7 +198,9 @@ def move_item(item: Item, box: Box):
         flash('Please select a destination box.', 'warning')
         return redirect(url_for('boxes.view_box', box_id=box.id))
     
-    new_box = Box.query.get_or_404(new_box_id)
+    new_box = db.session.get(Box, new_box_id, options=[raiseload('*')])
+    if new_box is None:
+        abort(404)
     if not new_box.is_owned_by(current_user.id):
         logger.warning("Attempted to move item to unauthorized box", extra={
             'item_id': item.id,
@@ -2,7 +2,7 @@
 """Main/public routes."""
 import logging
 
-from flask import Blueprint, jsonify, redirect, render_template, url_for
+from flask import Blueprint, jsonify, make_response, redirect, render_template, request, url_for
 from flask_login import current_user
 
 from garage.extensions import db
@@ -17,7 +17,13 @@ def index():
     """Display the landing page."""
     if current_user.is_authenticated:
         return redirect(url_for('boxes.dashboard'))
-    return render_template('index.html')
+    
+    # Let browsers revalidate with an ETag; unchanged pages come back as 304.
+    response = make_response(render_template('index.html'))
+    response.add_etag()
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 
 @bp.route('/health')
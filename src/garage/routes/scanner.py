@@ -2,8 +2,10 @@
 """QR scanner and search routes."""
 import logging
 
-from flask import Blueprint, flash, redirect, render_template, request, url_for
+from flask import Blueprint, abort, flash, redirect, render_template, request, url_for
 from flask_login import current_user, login_required
+from sqlalchemy import select
+from sqlalchemy.orm import contains_eager, selectinload
 
 from garage.extensions import db
 from garage.models import Box, Item
@@ -25,15 +27,19 @@ def scanner():
 @login_required
 def scan_redirect(box_id: int):
     """Handle QR code scan redirect."""
-    box = Box.query.get_or_404(box_id)
+    # Only ownership matters here; view_box loads the box itself.
+    owner_id = db.session.scalar(select(Box.user_id).where(Box.id == box_id))
     
-    if not box.is_owned_by(current_user.id):
+    if owner_id is None:
+        abort(404)
+    
+    if owner_id != current_user.id:
         logger.warning("QR scan for unauthorized box", extra={'user_id': current_user.id, 'box_id': box_id})
         flash('You do not have permission to view this box.', 'danger')
         return redirect(url_for('boxes.dashboard'))
     
     logger.info("QR scan successful", extra={'user_id': current_user.id, 'box_id': box_id})
-    return redirect(url_for('boxes.view_box', box_id=box.id))
+    return redirect(url_for('boxes.view_box', box_id=box_id))
 
 
 @bp.route('/search')
@@ -46,12 +52,9 @@ def search():
     
     boxes_results = []
     items_results = []
-    categories = []
-    
-    user_boxes = Box.query.filter_by(user_id=current_user.id).all()
-    box_ids = [box.id for box in user_boxes]
     
     if query:
+        pattern = f'%{query}%'
         logger.info("Search performed", extra={
             'user_id': current_user.id,
             'query': query,
@@ -60,22 +63,24 @@ def search():
         })
         
         if search_type in ['all', 'boxes']:
-            boxes_results = Box.query.filter(
+            # Result cards show item counts and values; load all items in one extra query.
+            boxes_results = Box.query.options(selectinload(Box.items)).filter(
                 Box.user_id == current_user.id,
                 db.or_(
-                    Box.name.ilike(f'%{query}%'),
-                    Box.location.ilike(f'%{query}%'),
-                    Box.description.ilike(f'%{query}%')
+                    Box.name.ilike(pattern),
+                    Box.location.ilike(pattern),
+                    Box.description.ilike(pattern)
                 )
             ).order_by(Box.name).all()
         
-        if search_type in ['all', 'items'] and box_ids:
-            items_query = Item.query.filter(
-                Item.box_id.in_(box_ids),
+        if search_type in ['all', 'items']:
+            # The results table shows each item's box; fill it from the same JOIN.
+            items_query = Item.query.join(Item.box).options(contains_eager(Item.box)).filter(
+                Box.user_id == current_user.id,
                 db.or_(
-                    Item.name.ilike(f'%{query}%'),
-                    Item.category.ilike(f'%{query}%'),
-                    Item.notes.ilike(f'%{query}%')
+                    Item.name.ilike(pattern),
+                    Item.category.ilike(pattern),
+                    Item.notes.ilike(pattern)
                 )
             )
             
@@ -84,13 +89,7 @@ def search():
             
             items_results = items_query.order_by(Item.name).all()
     
-    if box_ids:
-        category_rows = db.session.query(Item.category).filter(
-            Item.box_id.in_(box_ids),
-            Item.category.isnot(None),
-            Item.category != ''
-        ).distinct().all()
-        categories = sorted([row[0] for row in category_rows])
+    categories = Item.categories_for_user(current_user.id)
     
     return render_template(
         'search.html',
@@ -1,57 +1,19 @@
 # src/garage/services/email_service.py
 """Email service for transactional emails."""
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-from flask import current_app, url_for
+from flask import Flask, current_app, url_for
 from flask_mail import Message
 
 from garage.extensions import mail
 
 logger = logging.getLogger(__name__)
 
+# SMTP round trips take seconds; send on a small pool so requests return immediately.
+_mail_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='mail')
 
-class EmailService:
-    """Service for sending transactional emails."""
-    
-    @staticmethod
-    def send_password_reset(user) -> bool:
-        """Send password reset email to user."""
-        token = user.get_reset_token()
-        reset_url = url_for('auth.reset_password', token=token, _external=True)
-        
-        if current_app.config.get('MAIL_SUPPRESS_SEND', False):
-            logger.info("Password reset email (suppressed)", extra={'user_id': user.id, 'email': user.email})
-            print(f"\n{'='*60}")
-            print("📧 PASSWORD RESET EMAIL (Development Mode)")
-            print(f"{'='*60}")
-            print(f"To: {user.email}")
-            print(f"Reset Link: {reset_url}")
-            print(f"{'='*60}\n")
-            return True
-        
-        msg = Message(
-            subject='Password Reset Request - Garage Inventory',
-            recipients=[user.email]
-        )
-        msg.body = EmailService._get_reset_email_text(user.username, reset_url)
-        msg.html = EmailService._get_reset_email_html(user.username, reset_url)
-        
-        try:
-            mail.send(msg)
-            logger.info("Password reset email sent", extra={'user_id': user.id, 'email': user.email})
-            return True
-        except Exception as e:
-            logger.error("Failed to send password reset email", extra={
-                'user_id': user.id,
-                'email': user.email,
-                'error': str(e)
-            }, exc_info=True)
-            return False
-    
-    @staticmethod
-    def _get_reset_email_text(username: str, reset_url: str) -> str:
-        """Generate plain text email content."""
-        return f"""Hello {username},
+RESET_EMAIL_TEXT = """Hello {username},
 
 You requested to reset your password for Garage Inventory.
 
@@ -66,10 +28,7 @@ Thanks,
 Garage Inventory
 """
 
-    @staticmethod
-    def _get_reset_email_html(username: str, reset_url: str) -> str:
-        """Generate HTML email content."""
-        return f"""
+RESET_EMAIL_HTML = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -111,3 +70,71 @@ Garage Inventory
 </body>
 </html>
 """
+
+
+class EmailService:
+    """Service for sending transactional emails."""
+    
+    @staticmethod
+    def send_password_reset(user) -> bool:
+        """Send password reset email to user."""
+        token = user.get_reset_token()
+        reset_url = url_for('auth.reset_password', token=token, _external=True)
+        
+        if current_app.config.get('MAIL_SUPPRESS_SEND', False):
+            logger.info("Password reset email (suppressed)", extra={'user_id': user.id, 'email': user.email})
+            print(f"\n{'='*60}")
+            print("📧 PASSWORD RESET EMAIL (Development Mode)")
+            print(f"{'='*60}")
+            print(f"To: {user.email}")
+            print(f"Reset Link: {reset_url}")
+            print(f"{'='*60}\n")
+            return True
+        
+        msg = Message(
+            subject='Password Reset Request - Garage Inventory',
+            recipients=[user.email]
+        )
+        msg.body = EmailService._get_reset_email_text(user.username, reset_url)
+        msg.html = EmailService._get_reset_email_html(user.username, reset_url)
+        
+        try:
+            _mail_executor.submit(
+                EmailService._send_in_background,
+                current_app._get_current_object(),
+                msg,
+                user.id
+            )
+            logger.info("Password reset email queued", extra={'user_id': user.id, 'email': user.email})
+            return True
+        except Exception as e:
+            logger.error("Failed to queue password reset email", extra={
+                'user_id': user.id,
+                'email': user.email,
+                'error': str(e)
+            }, exc_info=True)
+            return False
+    
+    @staticmethod
+    def _send_in_background(app: Flask, msg: Message, user_id: int) -> None:
+        """Send a message from a worker thread inside its own app context."""
+        with app.app_context():
+            try:
+                mail.send(msg)
+                logger.info("Password reset email sent", extra={'user_id': user_id, 'email': msg.recipients[0]})
+            except Exception as e:
+                logger.error("Failed to send password reset email", extra={
+                    'user_id': user_id,
+                    'email': msg.recipients[0],
+                    'error': str(e)
+                }, exc_info=True)
+    
+    @staticmethod
+    def _get_reset_email_text(username: str, reset_url: str) -> str:
+        """Generate plain text email content."""
+        return RESET_EMAIL_TEXT.format(username=username, reset_url=reset_url)
+
+    @staticmethod
+    def _get_reset_email_html(username: str, reset_url: str) -> str:
+        """Generate HTML email content."""
+        return RESET_EMAIL_HTML.format(username=username, reset_url=reset_url)
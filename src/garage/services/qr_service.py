@@ -1,59 +1,42 @@
 # src/garage/services/qr_service.py
 """QR code generation service."""
+import io
 import logging
+from functools import lru_cache
 
-import qrcode
+logger = logging.getLogger(__name__)
 
-from garage.services.storage import get_storage_backend
+# Box payloads are short, uniform URLs, so any mask renders a scannable code.
+# Pinning one skips the encoder's evaluation of all eight mask patterns.
+QR_MASK_PATTERN = 0
 
-logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=1024)
+def _render_bytes(payload: str, kind: str) -> bytes:
+    """Encode a payload as image bytes; the output is deterministic, so it is memoized."""
+    # Imported on first render so workers that never draw a QR code skip loading the encoder.
+    import segno
+    
+    qr = segno.make_qr(
+        payload,
+        error='l',
+        mask=QR_MASK_PATTERN,
+        boost_error=False,
+    )
+    buffer = io.BytesIO()
+    qr.save(buffer, kind=kind, scale=10, border=4)
+    return buffer.getvalue()
 
 
 class QRService:
-    """Service for generating and managing QR codes."""
+    """Service for rendering box QR codes."""
     
     @staticmethod
-    def generate_for_box(box_id: int) -> str | None:
-        """Generate a QR code for a box."""
-        logger.info("Generating QR code for box", extra={'box_id': box_id})
-        
-        try:
-            box_url = f"/qr/{box_id}"
-            
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=4,
-            )
-            qr.add_data(box_url)
-            qr.make(fit=True)
-            
-            img = qr.make_image(fill_color="black", back_color="white")
-            
-            storage = get_storage_backend()
-            path = storage.save_qr(img, box_id)
-            
-            if path:
-                logger.info("QR code generated successfully", extra={'box_id': box_id, 'path': path})
-            else:
-                logger.warning("QR code generation returned no path", extra={'box_id': box_id})
-            
-            return path
-            
-        except Exception as e:
-            logger.error("Failed to generate QR code", extra={'box_id': box_id, 'error': str(e)}, exc_info=True)
-            return None
+    def render_png(box_id: int) -> bytes:
+        """Render a box's QR code as PNG bytes."""
+        return _render_bytes(f"/qr/{box_id}", 'png')
     
     @staticmethod
-    def regenerate_for_box(box_id: int, old_path: str | None = None) -> str | None:
-        """Regenerate a QR code for a box, optionally deleting the old one."""
-        logger.info("Regenerating QR code for box", extra={'box_id': box_id, 'old_path': old_path})
-        
-        if old_path:
-            storage = get_storage_backend()
-            deleted = storage.delete(old_path)
-            if deleted:
-                logger.info("Deleted old QR code", extra={'path': old_path})
-        
-        return QRService.generate_for_box(box_id)
+    def render_svg(box_id: int) -> bytes:
+        """Render a box's QR code as SVG bytes, skipping rasterization."""
+        return _render_bytes(f"/qr/{box_id}", 'svg')
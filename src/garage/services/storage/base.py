@@ -4,8 +4,6 @@ from abc import ABC, abstractmethod
 import logging
 from typing import BinaryIO
 
-from PIL import Image
-
 
 class StorageBackend(ABC):
     """Abstract interface for file storage operations."""
@@ -18,11 +16,6 @@ class StorageBackend(ABC):
         """Save an uploaded image file. Returns path/URL or None on failure."""
         pass
     
-    @abstractmethod
-    def save_qr(self, image: Image.Image, box_id: int) -> str | None:
-        """Save a PIL Image (QR code). Returns path/URL or None on failure."""
-        pass
-    
     @abstractmethod
     def delete(self, file_path: str) -> bool:
         """Delete a file from storage. Returns True if successful."""
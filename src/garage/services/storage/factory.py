@@ -12,15 +12,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-_storage_backends: dict[int, StorageBackend] = {}
+EXTENSION_KEY = 'garage_storage'
 
 
 def get_storage_backend() -> StorageBackend:
-    """Get the configured storage backend (cached per app context)."""
-    app_id = id(current_app._get_current_object())
-    
-    if app_id in _storage_backends:
-        return _storage_backends[app_id]
+    """Get the configured storage backend (created once per app)."""
+    backend = current_app.extensions.get(EXTENSION_KEY)
+    if backend is not None:
+        return backend
     
     backend_type = current_app.config.get('STORAGE_BACKEND', 'local')
     
@@ -40,6 +39,7 @@ def get_storage_backend() -> StorageBackend:
             secret_access_key=current_app.config.get('S3_SECRET_ACCESS_KEY'),
             endpoint_url=current_app.config.get('S3_ENDPOINT_URL'),
             prefix=current_app.config.get('S3_PREFIX', 'garage-inventory'),
+            async_uploads=current_app.config.get('S3_ASYNC_UPLOADS', False),
         )
     else:
         logger.info("Creating local storage backend")
@@ -50,12 +50,11 @@ def get_storage_backend() -> StorageBackend:
             base_path=current_app.config.get('STORAGE_PATH', 'static')
         )
     
-    _storage_backends[app_id] = backend
+    current_app.extensions[EXTENSION_KEY] = backend
     return backend
 
 
 def reset_storage_backend() -> None:
-    """Reset the cached storage backend."""
-    global _storage_backends
-    _storage_backends = {}
+    """Reset the current app's cached storage backend."""
+    current_app.extensions.pop(EXTENSION_KEY, None)
     logger.info("Storage backend cache cleared")
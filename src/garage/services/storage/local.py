@@ -5,8 +5,6 @@ import uuid
 from pathlib import Path
 from typing import BinaryIO
 
-from PIL import Image
-
 from garage.services.storage.base import StorageBackend
 
 
@@ -56,27 +54,6 @@ class LocalStorageBackend(StorageBackend):
             }, exc_info=True)
             return None
     
-    def save_qr(self, image: Image.Image, box_id: int) -> str | None:
-        """Save PIL Image (QR code) to local filesystem."""
-        self.logger.info("Saving QR code locally", extra={'box_id': box_id})
-        
-        try:
-            filename = f"box_{box_id}.png"
-            filepath = self.qrcodes_path / filename
-            
-            image.save(filepath, format='PNG')
-            
-            relative_path = str(filepath)
-            self.logger.info("QR code saved locally", extra={'box_id': box_id, 'path': relative_path})
-            return relative_path
-            
-        except Exception as e:
-            self.logger.error("Failed to save QR code locally", extra={
-                'box_id': box_id,
-                'error': str(e)
-            }, exc_info=True)
-            return None
-    
     def delete(self, file_path: str) -> bool:
         """Delete file from local filesystem."""
         if not file_path:
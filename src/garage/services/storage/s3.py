@@ -1,17 +1,19 @@
 # src/garage/services/storage/s3.py
 """AWS S3 storage backend."""
-import io
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import BinaryIO
 from urllib.parse import urlparse
 
 import boto3
 from botocore.config import Config
 from botocore.exceptions import ClientError
-from PIL import Image
 
 from garage.services.storage.base import StorageBackend
 
+# Shared by all backends; boto3 clients are thread-safe.
+_upload_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='s3-upload')
+
 
 class S3StorageBackend(StorageBackend):
     """AWS S3 storage implementation."""
@@ -23,7 +25,8 @@ class S3StorageBackend(StorageBackend):
         access_key_id: str | None = None,
         secret_access_key: str | None = None,
         endpoint_url: str | None = None,
-        prefix: str = 'garage-inventory'
+        prefix: str = 'garage-inventory',
+        async_uploads: bool = False
     ):
         super().__init__()
         
@@ -31,6 +34,7 @@ class S3StorageBackend(StorageBackend):
         self.region = region
         self.prefix = prefix
         self.endpoint_url = endpoint_url
+        self.async_uploads = async_uploads
         
         client_config = Config(
             region_name=region,
@@ -53,16 +57,14 @@ class S3StorageBackend(StorageBackend):
             'storage_backend': 's3',
             'bucket': bucket_name,
             'region': region,
-            'prefix': prefix
+            'prefix': prefix,
+            'async_uploads': async_uploads
         })
     
     def _get_key(self, box_id: int, image_type: str, extension: str = 'png') -> str:
         """Generate S3 key for a file."""
-        if image_type == 'qr':
-            return f"{self.prefix}/qrcodes/box_{box_id}.png"
-        else:
-            unique_id = uuid.uuid4().hex[:8]
-            return f"{self.prefix}/images/box_{box_id}_{unique_id}.{extension}"
+        unique_id = uuid.uuid4().hex[:8]
+        return f"{self.prefix}/images/box_{box_id}_{unique_id}.{extension}"
     
     def _get_url(self, key: str) -> str:
         """Construct public URL for an S3 object."""
@@ -110,13 +112,21 @@ class S3StorageBackend(StorageBackend):
             content_type = content_types.get(ext, 'application/octet-stream')
             
             file.seek(0)
-            file_content = file.read()
             
-            self.client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=file_content,
-                ContentType=content_type,
+            if self.async_uploads:
+                # The request's stream closes with the request, so the worker needs its own copy.
+                # The key is known up front, so the URL can be stored before the upload lands.
+                _upload_executor.submit(self._put_in_background, key, file.read(), content_type, box_id)
+                url = self._get_url(key)
+                self.logger.info("Image upload queued for S3", extra={'box_id': box_id, 'key': key, 'url': url})
+                return url
+            
+            # Stream from the spooled upload; large files go up as multipart chunks.
+            self.client.upload_fileobj(
+                file,
+                self.bucket_name,
+                key,
+                ExtraArgs={'ContentType': content_type},
             )
             
             url = self._get_url(key)
@@ -137,41 +147,22 @@ class S3StorageBackend(StorageBackend):
             }, exc_info=True)
             return None
     
-    def save_qr(self, image: Image.Image, box_id: int) -> str | None:
-        """Save PIL Image (QR code) to S3."""
-        self.logger.info("Saving QR code to S3", extra={'box_id': box_id})
-        
+    def _put_in_background(self, key: str, body: bytes, content_type: str, box_id: int) -> None:
+        """Upload an object from a worker thread; the client's retry policy handles transient errors."""
         try:
-            buffer = io.BytesIO()
-            image.save(buffer, format='PNG')
-            buffer.seek(0)
-            
-            key = self._get_key(box_id, 'qr')
-            
             self.client.put_object(
                 Bucket=self.bucket_name,
                 Key=key,
-                Body=buffer.getvalue(),
-                ContentType='image/png',
+                Body=body,
+                ContentType=content_type,
             )
-            
-            url = self._get_url(key)
-            self.logger.info("QR code saved to S3", extra={'box_id': box_id, 'key': key, 'url': url})
-            return url
-            
-        except ClientError as e:
-            self.logger.error("Failed to save QR code to S3", extra={
-                'box_id': box_id,
-                'error': str(e),
-                'error_code': e.response['Error']['Code']
-            }, exc_info=True)
-            return None
+            self.logger.info("Image saved to S3", extra={'box_id': box_id, 'key': key})
         except Exception as e:
-            self.logger.error("Unexpected error saving QR code to S3", extra={
+            self.logger.error("Background image upload to S3 failed", extra={
                 'box_id': box_id,
+                'key': key,
                 'error': str(e)
             }, exc_info=True)
-            return None
     
     def delete(self, file_path: str) -> bool:
         """Delete file from S3."""
@@ -1,28 +1,47 @@
 # src/garage/utils/decorators.py
 """Custom decorators for route handlers."""
-from functools import wraps
+from functools import partial, wraps
 import logging
 from typing import Callable, Any
 
-from flask import flash, redirect, url_for
+from flask import abort, flash, redirect, url_for
 from flask_login import current_user
+from sqlalchemy import select
+from sqlalchemy.orm import contains_eager, raiseload
+
+from garage.extensions import db
+from garage.models import Box, Item
 
 logger = logging.getLogger(__name__)
 
 
-def owns_box(f: Callable) -> Callable:
-    """Decorator that verifies the current user owns the specified box."""
+def owns_box(f: Callable | None = None, *, options: tuple = ()) -> Callable:
+    """Decorator that verifies the current user owns the specified box.
+    
+    Optional SQLAlchemy loader ``options`` are applied when fetching the box,
+    e.g. ``@owns_box(options=(selectinload(Box.items),))``.
+    """
+    if f is None:
+        return partial(owns_box, options=options)
+    
     @wraps(f)
     def decorated_function(box_id: int, *args: Any, **kwargs: Any):
-        from garage.models import Box
-        
-        box = Box.query.get_or_404(box_id)
+        # Load and authorize in one statement; only a miss needs a second look.
+        box = db.session.scalars(
+            select(Box)
+            .options(*options)
+            .where(Box.id == box_id, Box.user_id == current_user.id)
+        ).one_or_none()
         
-        if not box.is_owned_by(current_user.id):
+        if box is None:
+            owner_id = db.session.scalar(select(Box.user_id).where(Box.id == box_id))
+            if owner_id is None:
+                abort(404)
+            
             logger.warning("Unauthorized box access attempt", extra={
                 'user_id': current_user.id,
                 'box_id': box_id,
-                'box_owner_id': box.user_id
+                'box_owner_id': owner_id
             })
             flash('You do not have permission to access this box.', 'danger')
             return redirect(url_for('boxes.dashboard'))
@@ -36,21 +55,32 @@ def owns_item(f: Callable) -> Callable:
     """Decorator that verifies the current user owns the specified item's box."""
     @wraps(f)
     def decorated_function(item_id: int, *args: Any, **kwargs: Any):
-        from garage.models import Item
+        # Load the item with its box and authorize in one JOIN; any other lazy load is a bug.
+        item = db.session.scalars(
+            select(Item)
+            .join(Item.box)
+            .options(contains_eager(Item.box), raiseload('*'))
+            .where(Item.id == item_id, Box.user_id == current_user.id)
+        ).one_or_none()
         
-        item = Item.query.get_or_404(item_id)
-        box = item.box
-        
-        if not box.is_owned_by(current_user.id):
+        if item is None:
+            row = db.session.execute(
+                select(Item.box_id, Box.user_id).join(Item.box).where(Item.id == item_id)
+            ).one_or_none()
+            if row is None:
+                abort(404)
+            
             logger.warning("Unauthorized item access attempt", extra={
                 'user_id': current_user.id,
                 'item_id': item_id,
-                'box_id': box.id,
-                'box_owner_id': box.user_id
+                'box_id': row.box_id,
+                'box_owner_id': row.user_id
             })
             flash('You do not have permission to access this item.', 'danger')
             return redirect(url_for('boxes.dashboard'))
         
+        box = item.box
+        
         return f(item=item, box=box, *args, **kwargs)
     
     return decorated_function
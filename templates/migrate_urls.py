@@ -49,7 +49,6 @@ URL_MAPPINGS = {
     'view_box': 'boxes.view_box',
     'edit_box': 'boxes.edit_box',
     'delete_box': 'boxes.delete_box',
-    'regenerate_qr': 'boxes.regenerate_qr',
     
     # Item routes
     'create_item': 'items.create_item',
@@ -180,4 +180,27 @@ def test_already_logged_in_redirect_from_register(test_client, init_database):
     # Try to access register page
     response = test_client.get('/register', follow_redirects=True)
     assert response.status_code == 200
-    assert b'already registered' in response.data
\ No newline at end of file
+    assert b'already registered' in response.data
+
+
+def test_login_upgrades_legacy_password_hash(test_client, init_database):
+    """Test that logging in with a werkzeug hash stores an Argon2 hash."""
+    from werkzeug.security import generate_password_hash
+    
+    from garage.extensions import db
+    from garage.models import User
+    
+    test_client.get('/logout', follow_redirects=True)
+    user = User.query.filter_by(username='testuser').first()
+    user.password_hash = generate_password_hash('testpassword123')
+    db.session.commit()
+    
+    response = test_client.post('/login', data={
+        'username': 'testuser',
+        'password': 'testpassword123'
+    }, follow_redirects=True)
+    assert b'Welcome back' in response.data
+    
+    db.session.expire_all()
+    assert User.query.filter_by(username='testuser').first().password_hash.startswith('$argon2id$')
+    test_client.get('/logout', follow_redirects=True)
\ No newline at end of file
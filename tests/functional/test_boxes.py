@@ -84,6 +84,33 @@ def test_view_box_shows_items(test_client, init_database):
     assert b'Test Item' in response.data
 
 
+def test_box_qr_image(test_client, init_database):
+    """Test that a box's QR code is served as a cacheable PNG."""
+    test_client.post('/login', data={
+        'username': 'testuser',
+        'password': 'testpassword123'
+    })
+    
+    response = test_client.get('/box/1/qr.png')
+    assert response.status_code == 200
+    assert response.mimetype == 'image/png'
+    assert response.data.startswith(b'\x89PNG')
+    assert response.cache_control.max_age == 365 * 24 * 3600
+
+
+def test_box_qr_svg(test_client, init_database):
+    """Test that a box's QR code is also served as SVG."""
+    test_client.post('/login', data={
+        'username': 'testuser',
+        'password': 'testpassword123'
+    })
+    
+    response = test_client.get('/box/1/qr.svg')
+    assert response.status_code == 200
+    assert response.mimetype == 'image/svg+xml'
+    assert b'<svg' in response.data
+
+
 def test_edit_box_page_get(test_client, init_database):
     """Test that edit box page loads with existing data."""
     test_client.post('/login', data={
@@ -140,6 +167,36 @@ def test_delete_box(test_client, init_database, test_app):
     assert b'deleted successfully' in response.data
 
 
+def test_delete_box_removes_items(test_client, init_database, test_app):
+    """Test that deleting a box also deletes its items."""
+    test_client.post('/login', data={
+        'username': 'testuser',
+        'password': 'testpassword123'
+    })
+    
+    test_client.post('/box/create', data={
+        'name': 'Box With Items',
+        'location': 'Shed'
+    }, follow_redirects=True)
+    
+    with test_app.app_context():
+        from garage.models import Box
+        box_id = Box.query.filter_by(name='Box With Items').first().id
+    
+    test_client.post(f'/box/{box_id}/item/create', data={
+        'name': 'Doomed Item',
+        'quantity': 1
+    }, follow_redirects=True)
+    
+    response = test_client.post(f'/box/{box_id}/delete', follow_redirects=True)
+    assert b'deleted successfully' in response.data
+    
+    with test_app.app_context():
+        from garage.models import Box, Item
+        assert Box.query.filter_by(id=box_id).first() is None
+        assert Item.query.filter_by(box_id=box_id).count() == 0
+
+
 def test_create_box_requires_login(test_client):
     """Test that creating a box requires login."""
     test_client.get('/logout', follow_redirects=True)
@@ -37,6 +37,82 @@ def test_create_item(test_client, init_database):
     assert b'New Test Item' in response.data
 
 
+def test_bulk_create_items(test_client, init_database):
+    """Test creating several items from one JSON request."""
+    test_client.post('/login', data={
+        'username': 'testuser',
+        'password': 'testpassword123'
+    })
+    
+    response = test_client.post('/box/1/items/bulk', json={'items': [
+        {'name': 'Bulk Screwdriver', 'quantity': 2, 'category': 'Tools', 'value': 4.5},
+        {'name': 'Bulk Tape', 'quantity': 1},
+    ]})
+    assert response.status_code == 201
+    assert response.get_json()['created'] == 2
+    
+    response = test_client.get('/box/1')
+    assert b'Bulk Screwdriver' in response.data
+    assert b'Bulk Tape' in response.data
+
+
+def test_bulk_create_items_invalid(test_client, init_database):
+    """Test that an invalid row rejects the whole bulk request."""
+    test_client.post('/login', data={
+        'username': 'testuser',
+        'password': 'testpassword123'
+    })
+    
+    response = test_client.post('/box/1/items/bulk', json={'items': [
+        {'name': 'Valid Item', 'quantity': 1},
+        {'name': '', 'quantity': 1},
+    ]})
+    assert response.status_code == 400
+    assert '1' in response.get_json()['items']
+
+
+def test_bulk_create_items_bad_types(test_client, init_database):
+    """Test that rows with wrong JSON types are rejected per row."""
+    test_client.post('/login', data={
+        'username': 'testuser',
+        'password': 'testpassword123'
+    })
+    
+    response = test_client.post('/box/1/items/bulk', json={'items': [
+        {'name': 'Bad Value', 'value': 'abc'},
+        {'name': 5},
+        {'name': 'String Quantity', 'quantity': '2'},
+        {'name': 'Bool Quantity', 'quantity': True},
+        'not an object',
+    ]})
+    assert response.status_code == 400
+    errors = response.get_json()['items']
+    assert 'value' in errors['0']
+    assert 'name' in errors['1']
+    assert 'quantity' in errors['2']
+    assert 'quantity' in errors['3']
+    assert '4' in errors
+
+
+def test_bulk_create_items_out_of_range(test_client, init_database):
+    """Test that negative numbers and long fields fail validation, not the database."""
+    test_client.post('/login', data={
+        'username': 'testuser',
+        'password': 'testpassword123'
+    })
+    
+    response = test_client.post('/box/1/items/bulk', json={'items': [
+        {'name': 'Negative Value', 'value': -5},
+        {'name': 'Negative Quantity', 'quantity': -1},
+        {'name': 'Long Category', 'category': 'x' * 200},
+    ]})
+    assert response.status_code == 400
+    errors = response.get_json()['items']
+    assert 'value' in errors['0']
+    assert 'quantity' in errors['1']
+    assert 'category' in errors['2']
+
+
 def test_edit_item_page_get(test_client, init_database):
     """Test that edit item page loads."""
     test_client.post('/login', data={
@@ -11,6 +11,15 @@ def test_home_page_get(test_client):
     assert b'Garage Inventory' in response.data
 
 
+def test_home_page_conditional_get(test_client):
+    """Test that home page answers 304 when the ETag still matches."""
+    response = test_client.get('/')
+    etag = response.headers['ETag']
+    
+    response = test_client.get('/', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+
+
 def test_health_check(test_client):
     """Test health check endpoint."""
     response = test_client.get('/health')
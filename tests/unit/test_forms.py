@@ -172,6 +172,27 @@ def test_item_form_default_quantity(test_app):
         assert form.quantity.data == 1
 
 
+def test_item_form_populate_obj(test_app, new_item):
+    """
+    GIVEN a valid ItemForm
+    WHEN populating an Item from it
+    THEN the item columns are copied and value is stored as a float
+    """
+    with test_app.app_context():
+        form = ItemForm(data={
+            'name': 'Hammer',
+            'quantity': 2,
+            'category': 'Tools',
+            'value': '12.50',
+            'notes': ''
+        })
+        form.populate_obj(new_item)
+        assert new_item.name == 'Hammer'
+        assert new_item.quantity == 2
+        assert new_item.value == 12.5
+        assert isinstance(new_item.value, float)
+
+
 def test_forgot_password_form_valid(test_app):
     """
     GIVEN a ForgotPasswordForm
@@ -254,4 +275,21 @@ def test_registration_form_password_mismatch(test_app):
             'confirm_password': 'different123'
         })
         assert form.validate() is False
-        assert 'Passwords must match' in str(form.confirm_password.errors)
\ No newline at end of file
+        assert 'Passwords must match' in str(form.confirm_password.errors)
+
+def test_registration_form_duplicate_username_and_email(test_app, init_database):
+    """
+    GIVEN a RegistrationForm
+    WHEN both username and email belong to existing users
+    THEN both fields should report the conflict
+    """
+    with test_app.app_context():
+        form = RegistrationForm(data={
+            'username': 'testuser',
+            'email': 'test@example.com',
+            'password': 'password123',
+            'confirm_password': 'password123'
+        })
+        assert form.validate() is False
+        assert 'Username already taken' in str(form.username.errors)
+        assert 'Email already registered' in str(form.email.errors)
@@ -0,0 +1,214 @@
+# tests/unit/test_logging.py
+"""
+Unit tests for log formatters.
+"""
+import json
+import logging
+import struct
+import sys
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from garage import logging_config
+from garage.logging_config import DevelopmentFormatter, JSONFormatter
+
+CREATED = 1700000000.25
+
+
+def _record(msg='Box created', level=logging.INFO, exc_info=None, **extra):
+    """Build a log record at a fixed time with the given extras."""
+    record = logging.getLogger('garage.test').makeRecord(
+        'garage.test', level, __file__, 1, msg, (), exc_info, extra=extra
+    )
+    record.created = CREATED
+    return record
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def json_formatter(request):
+    """JSONFormatter serializing with orjson and with the stdlib fallback."""
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+        yield JSONFormatter()
+    else:
+        with patch.object(logging_config, 'orjson', None):
+            yield JSONFormatter()
+
+
+def test_json_formatter_fields(json_formatter):
+    """Test the base keys and values of a JSON log line."""
+    data = json.loads(json_formatter.format(_record()))
+    
+    assert data == {
+        'timestamp': '2023-11-14T22:13:20.250000+00:00',
+        'level': 'INFO',
+        'logger': 'garage.test',
+        'message': 'Box created',
+    }
+
+
+def test_json_formatter_timestamp_matches_isoformat(json_formatter):
+    """Test that cached-second timestamps keep datetime.isoformat's layout."""
+    for created in (CREATED, CREATED + 0.5, CREATED + 61.125):
+        record = _record()
+        record.created = created
+        expected = datetime.fromtimestamp(created, timezone.utc).isoformat(timespec='microseconds')
+        assert json.loads(json_formatter.format(record))['timestamp'] == expected
+
+
+def test_json_formatter_extra_fields(json_formatter):
+    """Test that known extras are included and unknown ones are dropped."""
+    record = _record(user_id=1, box_id=2, error='boom', duration_ms=1.5, unrelated='x')
+    data = json.loads(json_formatter.format(record))
+    
+    assert data['user_id'] == 1
+    assert data['box_id'] == 2
+    assert data['error'] == 'boom'
+    assert data['duration_ms'] == 1.5
+    assert 'unrelated' not in data
+    assert 'item_id' not in data
+
+
+def test_json_formatter_non_json_values(json_formatter):
+    """Test that values without a JSON form are written with str()."""
+    data = json.loads(json_formatter.format(_record(error=Decimal('9.99'))))
+    assert data['error'] == '9.99'
+
+
+def test_json_formatter_request_context(test_app, json_formatter):
+    """Test that request id, path and method come from the request's log context."""
+    from flask import g
+    
+    with test_app.test_request_context('/dashboard'):
+        g.log_context = ('abcd1234', '/dashboard', 'GET')
+        data = json.loads(json_formatter.format(_record()))
+    
+    assert data['request_id'] == 'abcd1234'
+    assert data['path'] == '/dashboard'
+    assert data['method'] == 'GET'
+
+
+def test_json_formatter_exception(json_formatter):
+    """Test that exception tracebacks are included."""
+    try:
+        raise ValueError('bad value')
+    except ValueError:
+        record = _record(level=logging.ERROR, exc_info=sys.exc_info())
+    
+    data = json.loads(json_formatter.format(record))
+    assert 'ValueError: bad value' in data['exception']
+
+
+def test_development_formatter_extras():
+    """Test the development line with and without extras."""
+    formatter = DevelopmentFormatter()
+    
+    assert formatter.format(_record()).endswith('garage.test: Box created')
+    assert formatter.format(_record(box_id=2, user_id=1)).endswith(
+        'garage.test: Box created [user_id=1, box_id=2]'
+    )
+
+
+def _read_frames(path):
+    """Decode every length-prefixed MessagePack frame in a file."""
+    import msgpack
+    
+    data = path.read_bytes()
+    frames = []
+    offset = 0
+    while offset < len(data):
+        (length,) = struct.unpack('>I', data[offset:offset + 4])
+        frames.append(msgpack.unpackb(data[offset + 4:offset + 4 + length], raw=False))
+        offset += 4 + length
+    return frames
+
+
+def test_msgpack_handler_round_trip(tmp_path):
+    """Test that MessagePack frames decode back to the record fields."""
+    pytest.importorskip('msgpack')
+    from garage.logging_config import MsgPackFileHandler
+    
+    log_path = tmp_path / 'garage.msgpack'
+    handler = MsgPackFileHandler(str(log_path))
+    try:
+        handler.handle(_record())
+        handler.handle(_record('Item moved', level=logging.WARNING, item_id=3, error=Decimal('1.5')))
+    finally:
+        handler.close()
+    
+    first, second = _read_frames(log_path)
+    assert first == {
+        'timestamp': CREATED,
+        'level': 'INFO',
+        'logger': 'garage.test',
+        'message': 'Box created',
+    }
+    assert second['level'] == 'WARNING'
+    assert second['item_id'] == 3
+    assert second['error'] == '1.5'
+
+
+def test_msgpack_formatter_returns_str():
+    """Test that MsgPackFormatter keeps the Formatter contract of returning str."""
+    from garage.logging_config import MsgPackFormatter
+    
+    formatter = MsgPackFormatter()
+    output = formatter.format(_record(box_id=2))
+    
+    assert isinstance(output, str)
+    assert json.loads(output)['box_id'] == 2
+    assert formatter.log_data(_record())['timestamp'] == CREATED
+
+
+def test_configure_logging_msgpack(tmp_path, test_app):
+    """Test that msgpack logging writes to its own file, and needs a path."""
+    pytest.importorskip('msgpack')
+    from flask import Flask
+    
+    log_path = tmp_path / 'garage.msgpack'
+    app = Flask(__name__)
+    app.config.update(LOG_FORMAT='msgpack', LOG_LEVEL='INFO', LOG_MSGPACK_PATH=str(log_path))
+    try:
+        logging_config.configure_logging(app)
+        logging.getLogger('garage.test').info("Box created", extra={'box_id': 2})
+        
+        (frame,) = _read_frames(log_path)
+        assert frame['message'] == 'Box created'
+        assert frame['box_id'] == 2
+        
+        app.config['LOG_MSGPACK_PATH'] = None
+        with pytest.raises(ValueError):
+            logging_config.configure_logging(app)
+    finally:
+        logging_config.configure_logging(test_app)
+
+
+def test_query_count_warning_names_route_and_count(caplog):
+    """Test that the N+1 warning renders the route and count in the dev log line."""
+    from flask import Flask
+    from sqlalchemy import text
+    
+    from garage import _init_query_counter
+    from garage.extensions import db
+    
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI='sqlite://', QUERY_COUNT_WARN_THRESHOLD=2)
+    db.init_app(app)
+    _init_query_counter(app)
+    
+    @app.route('/boxes')
+    def boxes():
+        for _ in range(3):
+            db.session.execute(text('SELECT 1'))
+        return 'ok'
+    
+    with caplog.at_level(logging.WARNING, logger='garage'):
+        app.test_client().get('/boxes')
+    
+    (record,) = [r for r in caplog.records if r.getMessage().startswith('Possible N+1')]
+    assert DevelopmentFormatter().format(record).endswith(
+        'garage: Possible N+1: 3 queries for GET /boxes (threshold 2)'
+    )
@@ -29,6 +29,17 @@ def test_user_password_hashing(new_user):
     assert new_user.check_password('wrongpassword') is False
 
 
+def test_user_legacy_password_hash_upgraded(new_user):
+    """Test that a werkzeug hash still verifies and is upgraded to Argon2."""
+    from werkzeug.security import generate_password_hash
+    
+    new_user.password_hash = generate_password_hash('legacypassword')
+    assert new_user.check_password('wrongpassword') is False
+    assert new_user.check_password('legacypassword') is True
+    assert new_user.password_hash.startswith('$argon2id$')
+    assert new_user.check_password('legacypassword') is True
+
+
 def test_new_box(new_box):
     """
     GIVEN a Box model
@@ -117,6 +128,15 @@ def test_box_total_value(test_app, init_database):
         assert box.total_value == 127.50
 
 
+def test_box_total_values_for_boxes(test_app, init_database):
+    """Test batch total values computed with one aggregate query."""
+    with test_app.app_context():
+        box = Box.query.filter_by(name='Test Box').first()
+        totals = Box.total_values_for_boxes([box.id, 9999])
+        assert totals[box.id] == 127.50
+        assert 9999 not in totals
+
+
 def test_box_total_items(test_app, init_database):
     """
     GIVEN a Box with items
@@ -167,8 +187,101 @@ def test_user_reset_token(test_app, init_database):
         assert verified_user.id == user.id
 
 
+def test_user_reset_token_legacy_sha1(test_app, init_database):
+    """Test that tokens signed before the BLAKE2b switch still verify."""
+    with test_app.app_context():
+        from itsdangerous import URLSafeTimedSerializer
+        
+        user = User.query.filter_by(username='testuser').first()
+        token = URLSafeTimedSerializer(test_app.config['SECRET_KEY']).dumps(
+            user.email, salt='password-reset-salt'
+        )
+        assert User.verify_reset_token(token).id == user.id
+
+
 def test_user_reset_token_invalid(test_app, init_database):
     """Test that invalid reset token returns None."""
     with test_app.app_context():
         result = User.verify_reset_token('invalid-token')
-        assert result is None
\ No newline at end of file
+        assert result is None
+
+
+def test_user_get_cached(test_app, init_database):
+    """Test cached user lookup returns the same user on a cache hit."""
+    with test_app.app_context():
+        from garage.extensions import cache, db
+        
+        user = User.query.filter_by(username='testuser').first()
+        test_app.config['USER_CACHE_ENABLED'] = True
+        try:
+            assert User.get_cached(user.id).id == user.id
+            assert cache.get(User.cache_key(user.id)) is not None
+            
+            db.session.expunge_all()
+            cached_user = User.get_cached(user.id)
+            assert cached_user.username == 'testuser'
+            assert cached_user.check_password('testpassword123') is True
+        finally:
+            test_app.config['USER_CACHE_ENABLED'] = False
+            cache.delete(User.cache_key(user.id))
+
+
+def test_user_get_cached_disabled(test_app, init_database):
+    """Test that user lookups skip a per-process cache."""
+    with test_app.app_context():
+        from garage.extensions import cache
+        
+        user = User.query.filter_by(username='testuser').first()
+        assert User.get_cached(user.id).id == user.id
+        assert cache.get(User.cache_key(user.id)) is None
+
+
+def test_user_cache_invalidated_on_update(test_app, init_database):
+    """Test that updating a user drops its cached columns."""
+    with test_app.app_context():
+        from garage.extensions import cache, db
+        
+        user = User.query.filter_by(username='testuser').first()
+        cache.set(User.cache_key(user.id), {'id': user.id})
+        
+        user.set_password('testpassword123')
+        db.session.commit()
+        
+        assert cache.get(User.cache_key(user.id)) is None
+
+
+def test_item_categories_for_user(test_app, init_database):
+    """Test cached category lookup and its invalidation."""
+    with test_app.app_context():
+        from garage.extensions import db
+        
+        user = User.query.filter_by(username='testuser').first()
+        box = Box.query.filter_by(user_id=user.id).first()
+        test_app.config['CATEGORY_CACHE_ENABLED'] = True
+        try:
+            assert 'Tools' in Item.categories_for_user(user.id)
+            
+            db.session.add(Item(name='Cached Category Item', quantity=1, category='Garden', box_id=box.id))
+            db.session.commit()
+            assert 'Garden' not in Item.categories_for_user(user.id)
+            
+            Item.clear_categories_cache(user.id)
+            assert 'Garden' in Item.categories_for_user(user.id)
+        finally:
+            test_app.config['CATEGORY_CACHE_ENABLED'] = False
+            Item.clear_categories_cache(user.id)
+
+
+def test_item_categories_for_user_cache_disabled(test_app, init_database):
+    """Test that category lookups skip a per-process cache."""
+    with test_app.app_context():
+        from garage.extensions import cache, db
+        
+        user = User.query.filter_by(username='testuser').first()
+        box = Box.query.filter_by(user_id=user.id).first()
+        assert 'Tools' in Item.categories_for_user(user.id)
+        assert cache.get(Item.categories_cache_key(user.id)) is None
+        
+        db.session.add(Item(name='Uncached Category Item', quantity=1, category='Workshop', box_id=box.id))
+        db.session.commit()
+        assert 'Workshop' in Item.categories_for_user(user.id)
@@ -8,24 +8,11 @@ from unittest.mock import patch, MagicMock
 from garage.services import QRService, EmailService
 
 
-def test_qr_service_generate_for_box(test_app, init_database):
-    """Test QR code generation for a box."""
-    with test_app.app_context():
-        path = QRService.generate_for_box(1)
-        # Should return a path
-        assert path is not None
-        assert 'box_1' in path
-
-
-def test_qr_service_regenerate_for_box(test_app, init_database):
-    """Test QR code regeneration."""
-    with test_app.app_context():
-        # First generate
-        old_path = QRService.generate_for_box(1)
-        
-        # Then regenerate
-        new_path = QRService.regenerate_for_box(1, old_path)
-        assert new_path is not None
+def test_qr_service_render_png():
+    """Test QR code rendering to PNG bytes."""
+    png = QRService.render_png(1)
+    assert png.startswith(b'\x89PNG')
+    assert QRService.render_png(1) is png
 
 
 def test_email_service_password_reset_suppressed(test_app, test_client, init_database):
@@ -37,4 +24,67 @@ def test_email_service_password_reset_suppressed(test_app, test_client, init_dat
         
         # In testing config, mail should be suppressed
         result = EmailService.send_password_reset(user)
-        assert result is True  # Should succeed even when suppressed
\ No newline at end of file
+        assert result is True  # Should succeed even when suppressed
+
+
+def test_email_service_password_reset_queued(test_app, init_database):
+    """Test that a real password reset email is handed to the background pool."""
+    with test_app.test_request_context():
+        from garage.models import User
+        from garage.services import email_service
+        
+        user = User.query.filter_by(username='testuser').first()
+        test_app.config['MAIL_SUPPRESS_SEND'] = False
+        try:
+            with patch.object(email_service._mail_executor, 'submit') as mock_submit:
+                assert EmailService.send_password_reset(user) is True
+                mock_submit.assert_called_once()
+        finally:
+            test_app.config['MAIL_SUPPRESS_SEND'] = True
+
+
+def test_email_service_password_reset_sent_in_background(test_app, init_database):
+    """Test that the queued job sends the reset email inside its own app context."""
+    with test_app.test_request_context():
+        from garage.models import User
+        from garage.services import email_service
+        
+        user = User.query.filter_by(username='testuser').first()
+        test_app.config['MAIL_SUPPRESS_SEND'] = False
+        try:
+            with patch.object(email_service._mail_executor, 'submit', side_effect=lambda fn, *args: fn(*args)), \
+                    patch.object(email_service.mail, 'send') as mock_send:
+                assert EmailService.send_password_reset(user) is True
+                mock_send.assert_called_once()
+                assert mock_send.call_args[0][0].recipients == [user.email]
+        finally:
+            test_app.config['MAIL_SUPPRESS_SEND'] = True
+
+
+def test_email_service_background_send_failure_logged(test_app, init_database):
+    """Test that a failed background send is logged instead of raised."""
+    with test_app.test_request_context():
+        from garage.models import User
+        from garage.services import email_service
+        
+        user = User.query.filter_by(username='testuser').first()
+        test_app.config['MAIL_SUPPRESS_SEND'] = False
+        try:
+            with patch.object(email_service._mail_executor, 'submit', side_effect=lambda fn, *args: fn(*args)), \
+                    patch.object(email_service.mail, 'send', side_effect=OSError('smtp down')), \
+                    patch.object(email_service.logger, 'error') as mock_error:
+                assert EmailService.send_password_reset(user) is True
+                mock_error.assert_called_once()
+                assert mock_error.call_args[1]['extra']['error'] == 'smtp down'
+        finally:
+            test_app.config['MAIL_SUPPRESS_SEND'] = True
+
+
+def test_email_service_reset_templates():
+    """Test that reset email bodies include the username and link."""
+    text = EmailService._get_reset_email_text('testuser', 'http://localhost/reset/abc')
+    html = EmailService._get_reset_email_html('testuser', 'http://localhost/reset/abc')
+    
+    assert 'Hello testuser,' in text
+    assert 'http://localhost/reset/abc' in text
+    assert 'href="http://localhost/reset/abc"' in html
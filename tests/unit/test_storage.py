@@ -8,7 +8,7 @@ from pathlib import Path
 from io import BytesIO
 from unittest.mock import MagicMock, patch
 
-from PIL import Image
+PNG_BYTES = b'\x89PNG\r\n\x1a\n'
 
 
 def test_local_storage_init(test_app):
@@ -24,24 +24,6 @@ def test_local_storage_init(test_app):
             assert (Path(tmpdir) / 'qrcodes').exists()
 
 
-def test_local_storage_save_qr(test_app):
-    """Test saving QR code to local storage."""
-    with test_app.app_context():
-        from garage.services.storage.local import LocalStorageBackend
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = LocalStorageBackend(base_path=tmpdir)
-            
-            # Create a test image
-            img = Image.new('RGB', (100, 100), color='white')
-            
-            path = storage.save_qr(img, box_id=1)
-            
-            assert path is not None
-            assert 'box_1' in path
-            assert Path(path).exists()
-
-
 def test_local_storage_delete(test_app):
     """Test deleting file from local storage."""
     with test_app.app_context():
@@ -50,9 +32,9 @@ def test_local_storage_delete(test_app):
         with tempfile.TemporaryDirectory() as tmpdir:
             storage = LocalStorageBackend(base_path=tmpdir)
             
-            # Create a test image and save it
-            img = Image.new('RGB', (100, 100), color='white')
-            path = storage.save_qr(img, box_id=1)
+            # Create a test file
+            path = str(storage.images_path / 'box_1_test.png')
+            Path(path).write_bytes(PNG_BYTES)
             
             # Verify it exists
             assert Path(path).exists()
@@ -84,8 +66,8 @@ def test_local_storage_exists(test_app):
             storage = LocalStorageBackend(base_path=tmpdir)
             
             # Create a test file
-            img = Image.new('RGB', (100, 100), color='white')
-            path = storage.save_qr(img, box_id=1)
+            path = str(storage.images_path / 'box_1_test.png')
+            Path(path).write_bytes(PNG_BYTES)
             
             assert storage.exists(path) is True
             assert storage.exists('/nonexistent/file.png') is False
@@ -118,4 +100,48 @@ def test_storage_factory_local(test_app):
         from garage.services.storage.local import LocalStorageBackend
         
         storage = get_storage_backend()
-        assert isinstance(storage, LocalStorageBackend)
\ No newline at end of file
+        assert isinstance(storage, LocalStorageBackend)
+
+
+def test_s3_storage_async_upload_queued(test_app):
+    """Test that async mode queues the upload and returns the final URL."""
+    with test_app.app_context():
+        from garage.services.storage import s3
+        
+        with patch.object(s3.boto3, 'client') as mock_client_factory, \
+                patch.object(s3._upload_executor, 'submit') as mock_submit:
+            storage = s3.S3StorageBackend(bucket_name='test-bucket', async_uploads=True)
+            upload = BytesIO(PNG_BYTES)
+            upload.filename = 'photo.png'
+            
+            url = storage.save_image(upload, box_id=1)
+            
+            assert url.startswith('https://test-bucket.s3.eu-west-2.amazonaws.com/garage-inventory/images/box_1_')
+            mock_submit.assert_called_once()
+            func, key, body, content_type, box_id = mock_submit.call_args[0]
+            assert func == storage._put_in_background
+            assert url.endswith(key)
+            assert (body, content_type, box_id) == (PNG_BYTES, 'image/png', 1)
+            mock_client_factory.return_value.upload_fileobj.assert_not_called()
+
+
+def test_s3_storage_background_upload_failure_logged(test_app):
+    """Test that a failed background upload is logged instead of raised."""
+    with test_app.app_context():
+        from garage.services.storage import s3
+        
+        with patch.object(s3.boto3, 'client') as mock_client_factory:
+            mock_client_factory.return_value.put_object.side_effect = OSError('connection reset')
+            storage = s3.S3StorageBackend(bucket_name='test-bucket', async_uploads=True)
+            
+            with patch.object(storage.logger, 'error') as mock_error:
+                storage._put_in_background('garage-inventory/images/box_1_abc.png', PNG_BYTES, 'image/png', 1)
+            
+            mock_client_factory.return_value.put_object.assert_called_once_with(
+                Bucket='test-bucket',
+                Key='garage-inventory/images/box_1_abc.png',
+                Body=PNG_BYTES,
+                ContentType='image/png',
+            )
+            mock_error.assert_called_once()
+            assert mock_error.call_args[1]['extra']['error'] == 'connection reset'